@@ -0,0 +1 @@
+"""Offline benchmarks for the Sector Alarm integration."""
@@ -0,0 +1,133 @@
+"""Micro-benchmark for the coordinator component normalizer.
+
+Times _process_category_devices on a single housecheck payload with a
+configurable number of components and reports the cost per component, for
+both the first refresh (devices created) and later refreshes (devices
+updated in place). A copy of the previous per-field _add_sensor_if_present
+approach is timed alongside for comparison.
+
+Run from the repository root in an environment with Home Assistant
+installed:
+
+    python -m benchmarks.bench_normalizer --components 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import timeit
+from typing import Any
+
+from custom_components.sector.coordinator import (
+    SectorDataUpdateCoordinator,
+    normalize_component,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def build_payload(components: int) -> dict[str, Any]:
+    """Return a Doors and Windows style payload with the given component count."""
+    places = []
+    for index in range(components):
+        places.append(
+            {
+                "Name": f"Room {index}",
+                "Components": [
+                    {
+                        "Label": f"Door {index}",
+                        "SerialNo": f"{index:08d}",
+                        "Type": "1",
+                        "Closed": index % 2 == 0,
+                        "LowBattery": False,
+                        "Alarm": False,
+                        "Temperature": "21.5",
+                    }
+                ],
+            }
+        )
+    return {"Sections": [{"Places": places}]}
+
+
+def legacy_add_sensor_if_present(
+    sensors: dict, component: dict, sensor_key: str, source_keys: Any, transform=None
+) -> None:
+    """Previous per-field lookup, kept for comparison."""
+    if isinstance(source_keys, str):
+        source_keys = [source_keys]
+    for key in source_keys:
+        if key in component:
+            value = component[key]
+            if transform:
+                try:
+                    value = transform(value)
+                except ValueError:
+                    return
+            sensors[sensor_key] = value
+            _LOGGER.debug(
+                "Successfully added sensor '%s' with value '%s'", sensor_key, value
+            )
+            return
+    _LOGGER.debug("Sensor keys %s were not found for '%s'", source_keys, sensor_key)
+
+
+def legacy_normalize(component: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a component the way the five separate calls did."""
+    sensors: dict[str, Any] = {}
+    legacy_add_sensor_if_present(sensors, component, "closed", "Closed", bool)
+    legacy_add_sensor_if_present(
+        sensors, component, "low_battery", ["LowBattery", "BatteryLow"], bool
+    )
+    legacy_add_sensor_if_present(sensors, component, "alarm", "Alarm", bool)
+    legacy_add_sensor_if_present(
+        sensors, component, "temperature", "Temperature", float
+    )
+    legacy_add_sensor_if_present(sensors, component, "humidity", "Humidity", float)
+    return sensors
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = build_payload(args.components)
+    components = [
+        component
+        for place in payload["Sections"][0]["Places"]
+        for component in place["Components"]
+    ]
+
+    def first_refresh() -> None:
+        SectorDataUpdateCoordinator._process_category_devices(
+            "Doors and Windows", payload, {}, set(), set()
+        )
+
+    devices: dict = {}
+    SectorDataUpdateCoordinator._process_category_devices(
+        "Doors and Windows", payload, devices, set(), set()
+    )
+
+    def next_refresh() -> None:
+        SectorDataUpdateCoordinator._process_category_devices(
+            "Doors and Windows", payload, devices, set(), set()
+        )
+
+    cases = {
+        "normalize_component": lambda: [normalize_component(c) for c in components],
+        "legacy normalize": lambda: [legacy_normalize(c) for c in components],
+        "first refresh": first_refresh,
+        "next refresh": next_refresh,
+    }
+    print(f"{args.components} components, best of {args.repeat}")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        per_component = best / args.components * 1e6
+        print(f"{name:>20}: {best * 1e3:8.3f} ms  {per_component:6.2f} us/component")
+
+
+if __name__ == "__main__":
+    main()
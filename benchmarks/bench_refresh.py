@@ -0,0 +1,218 @@
+"""End to end refresh benchmark against the local Sector API stand-in.
+
+Starts benchmarks.fake_server, then refreshes either SectorAlarmAPI
+(retrieve_all_data for every endpoint) or the coordinator (due endpoints
+plus processing) a number of times and reports the p50/p95 refresh time,
+CPU time and requests per refresh. With --allocations the peak and net
+memory allocated per refresh are traced as well, which slows the
+refreshes down. Refreshes run closer together than the client's read
+cache lasts, so it is bypassed unless --read-cache is given.
+
+Latency, payload size and error rate apply to every route and can be
+overridden per route key, for example --route Humidity=0.5,100,0.1 for
+0.5 seconds latency, 100 components and 10% errors.
+
+Run from the repository root in an environment with Home Assistant
+installed:
+
+    python -m benchmarks.bench_refresh --target coordinator --refreshes 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from custom_components.sector.client import RateLimiter
+from custom_components.sector.const import CONF_CODE_FORMAT, CONF_PANEL_ID, DOMAIN
+from custom_components.sector.coordinator import SectorDataUpdateCoordinator
+from custom_components.sector.hub import SectorAccountHub
+
+from .fake_server import PANEL_ID, FakeSectorServer, RouteConfig
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench"
+
+
+@dataclass
+class BenchConfigEntry:
+    """The parts of a config entry the coordinator uses."""
+
+    data: dict[str, Any]
+    options: dict[str, Any]
+    entry_id: str = "bench"
+    domain: str = DOMAIN
+    title: str = "Sector Alarm bench"
+
+    def async_on_unload(self, func: Any) -> None:
+        """Nothing is unloaded in the benchmark."""
+
+
+@dataclass
+class Samples:
+    """Measurements of the timed refreshes."""
+
+    wall: list[float] = field(default_factory=list)
+    cpu: list[float] = field(default_factory=list)
+    requests: list[int] = field(default_factory=list)
+    peak_bytes: list[int] = field(default_factory=list)
+    net_bytes: list[int] = field(default_factory=list)
+    failures: int = 0
+
+
+def percentile(values: list[float], pct: int) -> float:
+    """Return a percentile, or the only value for a single sample."""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def parse_route(value: str) -> tuple[str, RouteConfig]:
+    """Parse KEY=latency[,components[,error_rate]]."""
+    key, _, settings = value.partition("=")
+    parts = [part for part in settings.split(",") if part]
+    config = RouteConfig()
+    if parts:
+        config.latency = float(parts[0])
+    if len(parts) > 1:
+        config.components = int(parts[1])
+    if len(parts) > 2:
+        config.error_rate = float(parts[2])
+    return key, config
+
+
+async def run(args: argparse.Namespace) -> Samples:
+    """Start the stand-in and time the refreshes."""
+    server = FakeSectorServer(
+        RouteConfig(args.latency, args.jitter, args.components, args.error_rate),
+        dict(args.route),
+        seed=args.seed,
+    )
+    url = await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hub = SectorAccountHub(hass, EMAIL, PASSWORD, args.dedicated_session, url)
+        if not args.rate_limit:
+            # Measure the client, not the request budget
+            hub.api.rate_limiter = RateLimiter(capacity=10**9, refill=10**9)
+
+        if args.target == "api":
+            api = hub.panel_api(PANEL_ID)
+
+            async def refresh() -> bool:
+                return bool(await api.retrieve_all_data(use_cache=args.read_cache))
+
+        else:
+            entry = BenchConfigEntry(
+                data={
+                    CONF_EMAIL: EMAIL,
+                    CONF_PASSWORD: PASSWORD,
+                    CONF_PANEL_ID: PANEL_ID,
+                },
+                options={CONF_CODE_FORMAT: 6},
+            )
+            coordinator = SectorDataUpdateCoordinator(hass, entry, hub)
+
+            async def refresh() -> bool:
+                if not args.read_cache:
+                    coordinator.api._recent.clear()
+                await coordinator.async_refresh()
+                return coordinator.last_update_success
+
+        # The first refresh logs in and fetches every endpoint, time it apart
+        start = time.perf_counter()
+        requests = server.total_requests
+        await refresh()
+        print(
+            f"first refresh: {(time.perf_counter() - start) * 1e3:.1f} ms, "
+            f"{server.total_requests - requests} requests"
+        )
+
+        samples = Samples()
+        if args.allocations:
+            tracemalloc.start()
+        for _ in range(args.refreshes):
+            if args.allocations:
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+            requests = server.total_requests
+            cpu = time.process_time()
+            start = time.perf_counter()
+            if not await refresh():
+                samples.failures += 1
+            samples.wall.append(time.perf_counter() - start)
+            samples.cpu.append(time.process_time() - cpu)
+            samples.requests.append(server.total_requests - requests)
+            if args.allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                samples.peak_bytes.append(peak - before)
+                samples.net_bytes.append(current - before)
+            if args.interval:
+                await asyncio.sleep(args.interval)
+        if args.allocations:
+            tracemalloc.stop()
+
+        await hub.async_close()
+        await hass.async_stop(force=True)
+
+    await server.stop()
+    if server.errors:
+        print(f"injected errors: {dict(server.errors)}")
+    return samples
+
+
+def report(samples: Samples) -> None:
+    """Print the summary of the timed refreshes."""
+    print(f"{len(samples.wall)} refreshes, {samples.failures} failed")
+    for name, values, scale, unit in (
+        ("refresh time", samples.wall, 1e3, "ms"),
+        ("cpu time", samples.cpu, 1e3, "ms"),
+        ("requests", samples.requests, 1, ""),
+        ("peak alloc", samples.peak_bytes, 1 / 1024, "KiB"),
+        ("net alloc", samples.net_bytes, 1 / 1024, "KiB"),
+    ):
+        if not values:
+            continue
+        print(
+            f"{name:>13}: p50 {percentile(values, 50) * scale:9.2f} {unit:3}"
+            f"  p95 {percentile(values, 95) * scale:9.2f} {unit:3}"
+            f"  mean {statistics.fmean(values) * scale:9.2f} {unit}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", choices=("api", "coordinator"), default="api")
+    parser.add_argument("--refreshes", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--components", type=int, default=10)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--route", type=parse_route, action="append", default=[])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--allocations", action="store_true")
+    parser.add_argument("--rate-limit", action="store_true")
+    parser.add_argument("--read-cache", action="store_true")
+    parser.add_argument("--dedicated-session", action="store_true")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+
+    report(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
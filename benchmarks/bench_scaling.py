@@ -0,0 +1,233 @@
+"""Scaling benchmark for coordinator processing on large installations.
+
+For each installation size, builds the payloads of every data route with
+benchmarks.payloads and times what the coordinator does with them after
+the fetch: JSON decoding, _process_devices and _process_event_logs. The
+first refresh (devices created, whole log walked) and a later refresh
+(a share of the devices changed, one new log entry) are timed apart, and
+tracemalloc measures the peak memory of the first refresh and the memory
+the processed data keeps.
+
+Run from the repository root in an environment with Home Assistant
+installed:
+
+    python -m benchmarks.bench_scaling --sizes 10,100,1000,10000
+
+With --chart the results are plotted to an image, which needs matplotlib.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib.util
+import json
+import tempfile
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from custom_components.sector.const import CONF_PANEL_ID
+from custom_components.sector.coordinator import SectorDataUpdateCoordinator
+from custom_components.sector.hub import SectorAccountHub
+from custom_components.sector.model import PanelStatus, SectorData
+
+from .bench_refresh import EMAIL, PASSWORD, BenchConfigEntry
+from .fake_server import PANEL_ID
+from .payloads import generate_api_data
+
+DEFAULT_SIZES = "10,30,100,300,1000,3000,10000"
+
+
+@dataclass(slots=True)
+class Result:
+    """Measurements of one installation size."""
+
+    components: int
+    devices: int
+    payload_bytes: int
+    decode: float
+    first: float
+    next: float
+    peak_bytes: int
+    retained_bytes: int
+
+
+def _refresh(
+    coordinator: SectorDataUpdateCoordinator, api_data: dict[str, Any], data: SectorData
+) -> None:
+    """Process fetched data the way _async_update_data does."""
+    coordinator._process_devices(api_data, data)
+    coordinator._process_event_logs(api_data.get("Logs", []), data.devices)
+
+
+def measure(
+    coordinator: SectorDataUpdateCoordinator,
+    components: int,
+    args: argparse.Namespace,
+) -> Result:
+    """Measure one installation size."""
+    log_entries = int(components * args.logs_per_component)
+    first_data = generate_api_data(components, log_entries, seed=args.seed)
+    next_data = generate_api_data(
+        components,
+        log_entries,
+        seed=args.seed,
+        refresh=1,
+        change_rate=args.change_rate,
+    )
+    bodies = {key: json.dumps(payload) for key, payload in first_data.items()}
+
+    def reset() -> SectorData:
+        coordinator._event_logs.clear()
+        coordinator._listed_serials.clear()
+        coordinator._log_high_water = None
+        coordinator._log_keys_at_high_water = set()
+        coordinator._unmatched_log_entries.clear()
+        return SectorData(panel_status=PanelStatus(), logs=coordinator._event_logs)
+
+    def decode() -> None:
+        for body in bodies.values():
+            json.loads(body)
+
+    def first() -> None:
+        _refresh(coordinator, first_data, reset())
+
+    def next_refresh() -> None:
+        data = reset()
+        _refresh(coordinator, first_data, data)
+        _refresh(coordinator, next_data, data)
+
+    # The later refresh is the difference between two refreshes and one
+    repeat = args.repeat
+    decode_time = min(timeit.repeat(decode, number=1, repeat=repeat))
+    first_time = min(timeit.repeat(first, number=1, repeat=repeat))
+    both_time = min(timeit.repeat(next_refresh, number=1, repeat=repeat))
+
+    gc.collect()
+    tracemalloc.start()
+    data = reset()
+    before, _ = tracemalloc.get_traced_memory()
+    _refresh(coordinator, first_data, data)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(
+        components=components,
+        devices=len(data.devices),
+        payload_bytes=sum(len(body) for body in bodies.values()),
+        decode=decode_time,
+        first=first_time,
+        next=max(both_time - first_time, 0.0),
+        peak_bytes=peak - before,
+        retained_bytes=retained - before,
+    )
+
+
+def report(results: list[Result]) -> None:
+    """Print a table of the results."""
+    print(
+        f"{'components':>10} {'devices':>8} {'payload':>10} {'decode':>10}"
+        f" {'first':>10} {'next':>10} {'per comp':>10} {'peak':>10} {'kept':>10}"
+    )
+    for result in results:
+        per_component = result.first / max(result.components, 1) * 1e6
+        print(
+            f"{result.components:>10} {result.devices:>8}"
+            f" {result.payload_bytes / 1024:>7.0f} KiB"
+            f" {result.decode * 1e3:>7.2f} ms"
+            f" {result.first * 1e3:>7.2f} ms"
+            f" {result.next * 1e3:>7.2f} ms"
+            f" {per_component:>7.2f} us"
+            f" {result.peak_bytes / 1024:>6.0f} KiB"
+            f" {result.retained_bytes / 1024:>6.0f} KiB"
+        )
+
+
+def chart(results: list[Result], path: str) -> None:
+    """Plot time and memory against the number of components."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    components = [result.components for result in results]
+    figure, (time_axis, memory_axis) = plt.subplots(1, 2, figsize=(12, 5))
+    for label, values in (
+        ("JSON decode", [result.decode for result in results]),
+        ("first refresh", [result.first for result in results]),
+        ("later refresh", [result.next for result in results]),
+    ):
+        time_axis.plot(components, [value * 1e3 for value in values], "o-", label=label)
+    time_axis.set_title("Processing time")
+    time_axis.set_ylabel("ms")
+
+    for label, values in (
+        ("peak", [result.peak_bytes for result in results]),
+        ("kept", [result.retained_bytes for result in results]),
+    ):
+        memory_axis.plot(
+            components, [value / 1024 for value in values], "o-", label=label
+        )
+    memory_axis.set_title("Memory of the first refresh")
+    memory_axis.set_ylabel("KiB")
+
+    for axis in (time_axis, memory_axis):
+        axis.set_xscale("log")
+        axis.set_yscale("log")
+        axis.set_xlabel("components")
+        axis.grid(True, which="both", alpha=0.3)
+        axis.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+    print(f"chart written to {path}")
+
+
+async def run(args: argparse.Namespace) -> list[Result]:
+    """Set up a coordinator and measure every size."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Nothing is fetched, the hub only provides the panel client
+        hub = SectorAccountHub(hass, EMAIL, PASSWORD, False)
+        entry = BenchConfigEntry(
+            data={CONF_EMAIL: EMAIL, CONF_PASSWORD: PASSWORD, CONF_PANEL_ID: PANEL_ID},
+            options={},
+        )
+        coordinator = SectorDataUpdateCoordinator(hass, entry, hub)
+        results = [measure(coordinator, size, args) for size in args.sizes]
+        await hub.async_close()
+        await hass.async_stop(force=True)
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=DEFAULT_SIZES,
+    )
+    parser.add_argument("--logs-per-component", type=float, default=1.0)
+    parser.add_argument("--change-rate", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chart", metavar="PATH")
+    args = parser.parse_args()
+    if args.chart and importlib.util.find_spec("matplotlib") is None:
+        parser.error("--chart needs matplotlib")
+
+    results = asyncio.run(run(args))
+    report(results)
+    if args.chart:
+        chart(results, args.chart)
+
+
+if __name__ == "__main__":
+    main()
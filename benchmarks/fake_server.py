@@ -0,0 +1,152 @@
+"""Local stand-in for the Sector Alarm API.
+
+Serves every route in endpoints.py, plus login, the panel list and camera
+images, from an aiohttp server on localhost. Latency, payload size and
+error rate can be set per route, and the requests served are counted per
+route, so the benchmarks can drive SectorAlarmAPI and the coordinator end
+to end without network access. Data routes answer with the synthetic
+payloads from benchmarks.payloads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from custom_components.sector.endpoints import get_action_endpoints, get_data_endpoints
+
+from .payloads import build_payload
+
+PANEL_ID = "1234"
+
+# Routes that are not in endpoints.py
+LOGIN = "Login"
+PANEL_LIST = "GetPanelList"
+CAMERA_IMAGE = "GetCameraImage"
+LOGOUT = "Logout"
+
+
+@dataclass(slots=True)
+class RouteConfig:
+    """How the stand-in answers one route."""
+
+    # Seconds to wait before answering, plus up to ``jitter`` more
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Devices, log entries or persons in the response
+    components: int = 10
+    # Share of requests answered with 503 Service Unavailable
+    error_rate: float = 0.0
+
+
+def _token(lifetime: int = 3600) -> str:
+    """Return an unsigned JWT with an expiry, like the login response."""
+    claims = json.dumps({"exp": int(time.time()) + lifetime}).encode()
+    payload = base64.urlsafe_b64encode(claims).rstrip(b"=").decode()
+    return f"eyJhbGciOiJub25lIn0.{payload}.sig"
+
+
+class FakeSectorServer:
+    """Sector Alarm API stand-in on localhost."""
+
+    def __init__(
+        self,
+        default: RouteConfig | None = None,
+        routes: dict[str, RouteConfig] | None = None,
+        panel_id: str = PANEL_ID,
+        seed: int = 0,
+    ) -> None:
+        """Initialize with a default route config and overrides by route key."""
+        self.default = default or RouteConfig()
+        self.routes = routes or {}
+        self.panel_id = panel_id
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._payloads: dict[str, bytes] = {}
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    def config(self, key: str) -> RouteConfig:
+        """Return the config of a route."""
+        return self.routes.get(key, self.default)
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests served."""
+        return self.requests.total()
+
+    async def start(self) -> str:
+        """Start serving on a free port and return the base URL."""
+        app = web.Application()
+        # Paths are the same whatever the host, build them from a placeholder
+        base = "http://stand-in"
+        for key, (method, url) in get_data_endpoints(self.panel_id, base).items():
+            app.router.add_route(method, urlsplit(url).path, self._handler(key))
+        for key, (method, url) in get_action_endpoints(base).items():
+            app.router.add_route(method, urlsplit(url).path, self._handler(key))
+        app.router.add_post("/api/Login/Login", self._handler(LOGIN))
+        app.router.add_post("/api/Login/Logout", self._handler(LOGOUT))
+        app.router.add_get("/api/account/GetPanelList", self._handler(PANEL_LIST))
+        app.router.add_post("/api/camera/GetCameraImage", self._handler(CAMERA_IMAGE))
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _body(self, key: str) -> bytes:
+        """Return the encoded response of a route, built once."""
+        if (body := self._payloads.get(key)) is None:
+            components = self.config(key).components
+            if key == LOGIN:
+                payload: Any = {"AuthorizationToken": _token()}
+            elif key == PANEL_LIST:
+                payload = [{"PanelId": self.panel_id, "DisplayName": "Bench panel"}]
+            elif key == CAMERA_IMAGE:
+                image = bytes(self._random.getrandbits(8) for _ in range(components))
+                payload = {"ImageData": base64.b64encode(image).decode()}
+            elif key in get_action_endpoints() or key == LOGOUT:
+                payload = {}
+            else:
+                payload = build_payload(key, components, self.seed)
+            body = self._payloads[key] = json.dumps(payload).encode()
+        return body
+
+    def _handler(self, key: str):
+        """Return the request handler of a route."""
+
+        async def handle(request: web.Request) -> web.Response:
+            self.requests[key] += 1
+            config = self.config(key)
+            if delay := config.latency + self._random.uniform(0, config.jitter):
+                await asyncio.sleep(delay)
+            if key != LOGIN and not request.headers.get("Authorization", "").startswith(
+                "Bearer "
+            ):
+                return web.Response(status=401)
+            if self._random.random() < config.error_rate:
+                self.errors[key] += 1
+                return web.Response(status=503)
+            return web.Response(body=self._body(key), content_type="application/json")
+
+        return handle
@@ -0,0 +1,302 @@
+"""Synthetic Sector Alarm payloads for large installations.
+
+Builds responses for every data route in endpoints.py, shaped like the
+real API: housecheck categories grouped in sections (floors) and places
+(rooms), temperature and humidity readings reported by the smoke
+detectors and door sensors that measure them, and a lock log that goes
+back as far as the number of entries asks for.
+
+Identities (serial numbers, labels, rooms) depend only on the component
+index, so payloads of different refreshes describe the same devices.
+Volatile values (door state, temperature, lock and plug state) change for
+a share of the components on each refresh after the first.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+# Data routes in the order retrieve_all_data returns them
+DATA_ROUTES = (
+    "Humidity",
+    "Doors and Windows",
+    "Leakage Detectors",
+    "Smoke Detectors",
+    "Cameras",
+    "Persons",
+    "Temperatures",
+    "Panel Status",
+    "Smartplug Status",
+    "Lock Status",
+    "Logs",
+)
+# Share of the components of an installation in each device category
+CATEGORY_SHARES = {
+    "Doors and Windows": 0.55,
+    "Smoke Detectors": 0.15,
+    "Leakage Detectors": 0.1,
+    "Smartplug Status": 0.1,
+    "Lock Status": 0.05,
+    "Cameras": 0.05,
+}
+# Share of the smoke detectors that also measure humidity
+HUMIDITY_SHARE = 0.5
+# Share of the door and window sensors that also measure temperature
+DOOR_TEMPERATURE_SHARE = 0.2
+# Components per place and places per section
+PLACE_SIZE = 4
+SECTION_SIZE = 25
+# Newest log entry of the first refresh and the time between entries
+LOG_START = datetime(2024, 6, 1, 12, 0, 0)
+LOG_STEP = timedelta(hours=3)
+LOG_EVENTS = ("lock", "unlock", "lock", "unlock", "lock_failed")
+LOG_CHANNELS = ("App", "Keypad", "Code", "Auto")
+
+
+def component_counts(components: int) -> dict[str, int]:
+    """Split a number of components over the device categories.
+
+    Every category gets at least one component once there are enough to
+    go round, the rest goes to doors and windows.
+    """
+    counts = {
+        key: max(
+            int(components * share), 1 if components >= len(CATEGORY_SHARES) else 0
+        )
+        for key, share in CATEGORY_SHARES.items()
+    }
+    counts["Doors and Windows"] += components - sum(counts.values())
+    return counts
+
+
+def _serial(prefix: str, index: int) -> str:
+    return f"{prefix}{index:06d}"
+
+
+def _changes(seed: int, refresh: int, change_rate: float) -> Callable[[], bool]:
+    """Return a function telling whether the next component changed."""
+    if not refresh or not change_rate:
+        return lambda: False
+    rng = random.Random(seed * 1_000_003 + refresh)
+    return lambda: rng.random() < change_rate
+
+
+def _housecheck(components: list[dict[str, Any]]) -> dict[str, Any]:
+    """Group components in places and sections."""
+    places = [
+        {
+            "Name": f"Room {start // PLACE_SIZE}",
+            "Components": components[start : start + PLACE_SIZE],
+        }
+        for start in range(0, len(components), PLACE_SIZE)
+    ]
+    return {
+        "Sections": [
+            {
+                "Name": f"Floor {start // SECTION_SIZE}",
+                "Places": places[start : start + SECTION_SIZE],
+            }
+            for start in range(0, len(places), SECTION_SIZE)
+        ]
+    }
+
+
+def _component(prefix: str, index: int, label: str, device_type: str) -> dict[str, Any]:
+    return {
+        "Label": f"{label} {index}",
+        "SerialNo": _serial(prefix, index),
+        "Type": device_type,
+        # One in fifty devices runs low on battery
+        "LowBattery": index % 50 == 49,
+    }
+
+
+def _temperature(index: int, changed: bool) -> str:
+    return f"{19 + index % 40 / 10 + (0.5 if changed else 0):.1f}"
+
+
+def _reading_sources(counts: dict[str, int], count: int) -> list[tuple[str, str]]:
+    """Return the serial numbers and labels of the devices reporting a reading.
+
+    Smoke detectors come first, then door and window sensors, then
+    standalone sensors that are in no other category.
+    """
+    sources = [
+        (_serial("SD", index), f"Smoke {index}")
+        for index in range(min(counts["Smoke Detectors"], count))
+    ]
+    sources += [
+        (_serial("DW", index), f"Door {index}")
+        for index in range(min(counts["Doors and Windows"], count - len(sources)))
+    ]
+    sources += [
+        (_serial("TS", index), f"Sensor {index}")
+        for index in range(count - len(sources))
+    ]
+    return sources
+
+
+def build_payload(
+    key: str,
+    count: int,
+    seed: int = 0,
+    refresh: int = 0,
+    change_rate: float = 0.0,
+    counts: dict[str, int] | None = None,
+) -> Any:
+    """Return the response of a data route with ``count`` components.
+
+    ``counts`` are the components per category of the installation, used
+    to pick the devices reporting temperature and humidity and the locks
+    named in the log. Without it they come from an installation of
+    ``count`` components.
+    """
+    changed = _changes(seed, refresh, change_rate)
+    counts = counts or component_counts(count)
+
+    if key == "Panel Status":
+        return {"Status": 1, "IsOnline": True, "ReadyToArm": True, "SerialNo": "P1"}
+    if key == "Doors and Windows":
+        components = []
+        for index in range(count):
+            # Every tenth sensor is a vibration sensor on a window
+            device_type = "vibrationsensor" if index % 10 == 9 else "1"
+            component = _component("DW", index, "Door", device_type)
+            component["Closed"] = (index % 7 != 0) != changed()
+            component["Alarm"] = False
+            components.append(component)
+        return _housecheck(components)
+    if key == "Smoke Detectors":
+        return _housecheck(
+            [
+                {
+                    **_component("SD", index, "Smoke", "smokedetectorsync"),
+                    "Alarm": False,
+                }
+                for index in range(count)
+            ]
+        )
+    if key == "Leakage Detectors":
+        return _housecheck(
+            [
+                {
+                    **_component("LD", index, "Leakage", "leakagedetector"),
+                    "Alarm": False,
+                }
+                for index in range(count)
+            ]
+        )
+    if key == "Temperatures":
+        return _housecheck(
+            [
+                {
+                    "Label": label,
+                    "SerialNo": serial,
+                    "Temperature": _temperature(index, changed()),
+                }
+                for index, (serial, label) in enumerate(_reading_sources(counts, count))
+            ]
+        )
+    if key == "Humidity":
+        return _housecheck(
+            [
+                {
+                    "Label": label,
+                    "SerialNo": serial,
+                    "Humidity": f"{40 + index % 20 + (5 if changed() else 0)}",
+                }
+                for index, (serial, label) in enumerate(_reading_sources(counts, count))
+            ]
+        )
+    if key == "Lock Status":
+        return [
+            {
+                "Serial": _serial("LO", index),
+                "Label": f"Lock {index}",
+                "Status": "unlock" if changed() else "lock",
+                "BatteryLow": index % 50 == 49,
+            }
+            for index in range(count)
+        ]
+    if key == "Smartplug Status":
+        return [
+            {
+                "Id": str(index),
+                "SerialNo": _serial("SP", index),
+                "Label": f"Plug {index}",
+                "State": "On" if (index % 2 == 1) != changed() else "Off",
+            }
+            for index in range(count)
+        ]
+    if key == "Cameras":
+        return [
+            {"SerialNo": _serial("CA", index), "Label": f"Camera {index}"}
+            for index in range(count)
+        ]
+    if key == "Persons":
+        return [
+            {"PersonId": str(index), "FirstName": f"Person {index}"}
+            for index in range(count)
+        ]
+    if key == "Logs":
+        return build_logs(count, max(counts["Lock Status"], 1), refresh)
+    # Unknown housecheck category
+    return _housecheck(
+        [{**_component("XX", index, key, ""), "Alarm": False} for index in range(count)]
+    )
+
+
+def build_logs(entries: int, locks: int, refresh: int = 0) -> list[dict[str, Any]]:
+    """Return a lock log, newest entry first.
+
+    Each refresh adds one entry on top, so ``entries`` entries cover
+    ``entries * LOG_STEP`` of history and the oldest entry drops off.
+    """
+    logs = []
+    for age in range(entries):
+        index = refresh - age
+        timestamp = LOG_START + index * LOG_STEP
+        logs.append(
+            {
+                "Time": timestamp.strftime("%Y-%m-%dT%H:%M:%S"),
+                "LockName": f"Lock {index % locks}",
+                "EventType": LOG_EVENTS[index % len(LOG_EVENTS)],
+                "User": f"Person {index % 5}",
+                "Channel": LOG_CHANNELS[index % len(LOG_CHANNELS)],
+            }
+        )
+    return logs
+
+
+def generate_api_data(
+    components: int,
+    log_entries: int = 0,
+    persons: int | None = None,
+    seed: int = 0,
+    refresh: int = 0,
+    change_rate: float = 0.0,
+) -> dict[str, Any]:
+    """Return retrieve_all_data style output for a whole installation.
+
+    ``components`` devices are split with component_counts; temperature
+    and humidity readings come from a share of them. ``change_rate`` is
+    the share of components whose volatile values differ from the first
+    refresh when ``refresh`` is above zero.
+    """
+    counts = component_counts(components)
+    sizes = {
+        **counts,
+        "Panel Status": 1,
+        "Temperatures": counts["Smoke Detectors"]
+        + int(counts["Doors and Windows"] * DOOR_TEMPERATURE_SHARE),
+        "Humidity": int(counts["Smoke Detectors"] * HUMIDITY_SHARE),
+        "Persons": persons if persons is not None else max(components // 50, 1),
+        "Logs": log_entries,
+    }
+    return {
+        key: build_payload(key, sizes[key], seed, refresh, change_rate, sizes)
+        for key in DATA_ROUTES
+    }
@@ -3,40 +3,146 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    BASE_PLATFORMS,
+    CONF_DEDICATED_SESSION,
+    DOMAIN,
+    MODEL_PLATFORMS,
+    PLATFORMS,
+)
+from .coordinator import (
+    SNAPSHOT_STORAGE_VERSION,
+    SectorAlarmConfigEntry,
+    SectorDataUpdateCoordinator,
+    snapshot_storage_key,
+)
+from .hub import async_get_hub, async_release_hub
+from .services import async_setup_services
 
-from homeassistant.core import HomeAssistant
+_LOGGER = logging.getLogger(__name__)
 
-from .const import PLATFORMS
-from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-_LOGGER = logging.getLogger(__name__)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Sector Alarm services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: SectorAlarmConfigEntry) -> bool:
     """Set up Sector Alarm from a config entry."""
-    coordinator = SectorDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    hub = async_get_hub(hass, entry)
+    # Also runs if setup fails, so the hub is released either way
+    entry.async_on_unload(partial(async_release_hub, hass, entry))
+    coordinator = SectorDataUpdateCoordinator(hass, entry, hub)
+    # Set up from the last snapshot if there is one and refresh in the
+    # background, so startup doesn't wait on the Sector cloud
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
     entry.runtime_data = coordinator
 
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.platforms = _needed_platforms(coordinator)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+    # Platforms being set up in the background
+    loading: set[Platform] = set()
+
+    async def _async_load_platforms(platforms: list[Platform]) -> None:
+        """Set up platforms, letting a later refresh retry them on failure."""
+        try:
+            await _async_forward_platforms(hass, entry, platforms)
+        finally:
+            loading.difference_update(platforms)
+
+    @callback
+    def _async_load_new_platforms() -> None:
+        """Set up the platforms of device models found by a refresh."""
+        if new := [
+            platform
+            for platform in _needed_platforms(coordinator)
+            if platform not in coordinator.platforms and platform not in loading
+        ]:
+            loading.update(new)
+            entry.async_create_background_task(
+                hass, _async_load_platforms(new), "sector_platforms"
+            )
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_load_new_platforms))
+
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh_restored(), "sector_refresh_restored"
+        )
 
     return True
 
 
+def _needed_platforms(coordinator: SectorDataUpdateCoordinator) -> list[Platform]:
+    """Return the platforms used by the panel and its device models."""
+    needed = set(BASE_PLATFORMS)
+    for model, platforms in MODEL_PLATFORMS.items():
+        if coordinator.data.of_model(model):
+            needed |= platforms
+    return [platform for platform in PLATFORMS if platform in needed]
+
+
+async def _async_forward_platforms(
+    hass: HomeAssistant, entry: SectorAlarmConfigEntry, platforms: list[Platform]
+) -> None:
+    """Set up more platforms for an entry that is already loaded.
+
+    They are only added to the platforms to unload once set up.
+    """
+    async with entry.setup_lock:
+        if entry.state is not ConfigEntryState.LOADED:
+            return
+        _LOGGER.debug("Setting up platforms for new device types: %s", platforms)
+        await hass.config_entries.async_forward_entry_setups(entry, platforms)
+        entry.runtime_data.platforms.extend(platforms)
+
+
 async def async_update_listener(
     hass: HomeAssistant, entry: SectorAlarmConfigEntry
 ) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply changed options, reloading only to change the account session."""
+    coordinator = entry.runtime_data
+    hub = coordinator.hub
+    dedicated_session = entry.options.get(CONF_DEDICATED_SESSION, False)
+    # A hub shared with other entries keeps its session until they unload
+    if hub.entry_ids == {entry.entry_id} and hub.dedicated_session != dedicated_session:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.async_apply_options()
 
 
 async def async_unload_entry(
     hass: HomeAssistant, entry: SectorAlarmConfigEntry
 ) -> bool:
     """Unload a Sector Alarm config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    return await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: SectorAlarmConfigEntry
+) -> None:
+    """Remove the snapshot of a deleted config entry."""
+    await Store(
+        hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(entry.entry_id)
+    ).async_remove()
 
 
 async def async_migrate_entry(
@@ -16,7 +16,11 @@ from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_CODE_FORMAT, CONF_PANEL_ID
-from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
+from .coordinator import (
+    PANEL_STATUS_CONTEXT,
+    SectorAlarmConfigEntry,
+    SectorDataUpdateCoordinator,
+)
 from .entity import SectorAlarmBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +47,7 @@ class SectorAlarmControlPanel(SectorAlarmBaseEntity, AlarmControlPanelEntity):
     """Representation of the Sector Alarm control panel."""
 
     _attr_name = None
+    _listener_context = PANEL_STATUS_CONTEXT
     _attr_supported_features = (
         AlarmControlPanelEntityFeature.ARM_AWAY
         | AlarmControlPanelEntityFeature.ARM_HOME
@@ -55,7 +60,7 @@ class SectorAlarmControlPanel(SectorAlarmBaseEntity, AlarmControlPanelEntity):
         super().__init__(
             coordinator,
             coordinator.config_entry.data[CONF_PANEL_ID],
-            "Sector Alarm Panel",
+            coordinator.panel_name,
             "Alarm panel",
         )
 
@@ -67,16 +72,17 @@ class SectorAlarmControlPanel(SectorAlarmBaseEntity, AlarmControlPanelEntity):
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the state of the device."""
-        status = self.coordinator.data.get("panel_status", {})
-        if not status.get("IsOnline", True):
+        status = self.coordinator.data.panel_status
+        if status.is_online is False:
             return None
 
         # Map status code to the appropriate Home Assistant state
-        status_code = status.get("Status", 0)
+        status_code = status.alarm_state
         mapped_state = ALARM_STATE_TO_HA_STATE.get(status_code)
-        _LOGGER.debug(
-            "Alarm status_code: %s, Mapped state: %s", status_code, mapped_state
-        )
+        if self._serial_no in self.coordinator.trace_serials:
+            _LOGGER.debug(
+                "Alarm status_code: %s, Mapped state: %s", status_code, mapped_state
+            )
         return mapped_state
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
@@ -85,9 +91,9 @@ class SectorAlarmControlPanel(SectorAlarmBaseEntity, AlarmControlPanelEntity):
             assert code is not None
         if not self._is_valid_code(code):
             raise ServiceValidationError("Invalid code length")
-        _LOGGER.debug("Arming away with code: %s", code)
+        _LOGGER.debug("Arming away")
         if await self.coordinator.api.arm_system("total", code=code):
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_fast_refresh()
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
@@ -95,9 +101,9 @@ class SectorAlarmControlPanel(SectorAlarmBaseEntity, AlarmControlPanelEntity):
             assert code is not None
         if not self._is_valid_code(code):
             raise ServiceValidationError("Invalid code length")
-        _LOGGER.debug("Arming home with code: %s", code)
+        _LOGGER.debug("Arming home")
         if await self.coordinator.api.arm_system("partial", code=code):
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_fast_refresh()
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
@@ -105,9 +111,9 @@ class SectorAlarmControlPanel(SectorAlarmBaseEntity, AlarmControlPanelEntity):
             assert code is not None
         if not self._is_valid_code(code):
             raise ServiceValidationError("Invalid code length")
-        _LOGGER.debug("Disarming with code: %s", code)
+        _LOGGER.debug("Disarming")
         if await self.coordinator.api.disarm_system(code=code):
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_fast_refresh()
 
     def _is_valid_code(self, code: str) -> bool:
         code_format = self.coordinator.config_entry.options[CONF_CODE_FORMAT]
@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_PANEL_ID
-from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
-from .entity import SectorAlarmBaseEntity
+from .coordinator import (
+    PANEL_STATUS_CONTEXT,
+    SectorAlarmConfigEntry,
+    SectorDataUpdateCoordinator,
+)
+from .entity import SectorAlarmBaseEntity, async_setup_device_entities
+from .model import Devices
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,40 +59,24 @@ async def async_setup_entry(
 ) -> None:
     """Set up Sector Alarm binary sensors."""
     coordinator = entry.runtime_data
-    devices: dict[str, Any] = coordinator.data.get("devices", {})
-    entities: list[
-        SectorAlarmBinarySensor
-        | SectorAlarmPanelOnlineBinarySensor
-        | SectorAlarmClosedSensor
-    ] = []
-
-    panel_status = coordinator.data.get("panel_status", {})
-    panel_id = entry.data[CONF_PANEL_ID]
-    serial_no = panel_status.get("SerialNo") or panel_id
-
-    for device in devices.values():
-        serial_no = device["serial_no"]
-        sensors = device.get("sensors", {})
-        device_name = device.get("name", "Unknown Device")
-        device_model = device.get("model", "")
-
-        for description in BINARY_SENSOR_TYPES:
-            if description.key == "online":
-                entities.append(
-                    SectorAlarmPanelOnlineBinarySensor(
-                        coordinator,
-                        serial_no,
-                        description,
-                        device_name,
-                        device_model,
-                    )
-                )
-                continue
 
-            if description.key in sensors:
-                if "closed" in sensors:
+    @callback
+    def _async_add_devices(devices: list[Devices]) -> None:
+        entities: list[
+            SectorAlarmBinarySensor
+            | SectorAlarmPanelOnlineBinarySensor
+            | SectorAlarmClosedSensor
+        ] = []
+
+        for device in devices:
+            serial_no = device.serial_no
+            device_name = device.name or "Unknown Device"
+            device_model = device.model
+
+            for description in BINARY_SENSOR_TYPES:
+                if description.key == "online":
                     entities.append(
-                        SectorAlarmClosedSensor(
+                        SectorAlarmPanelOnlineBinarySensor(
                             coordinator,
                             serial_no,
                             description,
@@ -97,22 +84,41 @@ async def async_setup_entry(
                             device_model,
                         )
                     )
-                    _LOGGER.debug("Added closed sensor for device %s", serial_no)
                     continue
 
-                entities.append(
-                    SectorAlarmBinarySensor(
-                        coordinator, serial_no, description, device_name, device_model
+                if getattr(device, description.key, None) is not None:
+                    if device.closed is not None:
+                        entities.append(
+                            SectorAlarmClosedSensor(
+                                coordinator,
+                                serial_no,
+                                description,
+                                device_name,
+                                device_model,
+                            )
+                        )
+                        _LOGGER.debug("Added closed sensor for device %s", serial_no)
+                        continue
+
+                    entities.append(
+                        SectorAlarmBinarySensor(
+                            coordinator,
+                            serial_no,
+                            description,
+                            device_name,
+                            device_model,
+                        )
                     )
-                )
-                _LOGGER.debug(
-                    "Added %s sensor for device %s", description.name, serial_no
-                )
+                    _LOGGER.debug(
+                        "Added %s sensor for device %s", description.name, serial_no
+                    )
+
+        if entities:
+            async_add_entities(entities)
+        else:
+            _LOGGER.debug("No binary sensor entities to add.")
 
-    if entities:
-        async_add_entities(entities)
-    else:
-        _LOGGER.debug("No binary sensor entities to add.")
+    async_setup_device_entities(hass, entry, _async_add_devices)
 
 
 class SectorAlarmBinarySensor(SectorAlarmBaseEntity, BinarySensorEntity):
@@ -137,10 +143,9 @@ class SectorAlarmBinarySensor(SectorAlarmBaseEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return True if the sensor is on."""
-        device = self.coordinator.data["devices"].get(self._serial_no)
+        device = self.coordinator.data.devices.get(self._serial_no)
         if device:
-            sensor_value = device["sensors"].get(self._sensor_type)
-            return bool(sensor_value)
+            return bool(getattr(device, self._sensor_type, None))
         return False
 
 
@@ -150,15 +155,16 @@ class SectorAlarmClosedSensor(SectorAlarmBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if the door/window is open (closed: False)."""
-        device = self.coordinator.data["devices"].get(self._serial_no)
-        return not device["sensors"].get("closed", True) if device else False
+        device = self.coordinator.data.devices.get(self._serial_no)
+        return device.closed is False if device else False
 
 
 class SectorAlarmPanelOnlineBinarySensor(SectorAlarmBinarySensor, BinarySensorEntity):
     """Binary sensor for the Sector Alarm panel online status."""
 
+    _listener_context = PANEL_STATUS_CONTEXT
+
     @property
     def is_on(self):
         """Return True if the panel is online."""
-        panel_status = self.coordinator.data.get("panel_status", {})
-        return panel_status.get("IsOnline", False)
+        return bool(self.coordinator.data.panel_status.is_online)
@@ -2,18 +2,103 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 
 from homeassistant.components.camera import Camera
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .client import SectorAlarmAPI
+from .const import (
+    CAMERA_IMAGE_CACHE_BYTES,
+    CONF_CAMERA_IMAGE_TTL,
+    DEFAULT_CAMERA_IMAGE_TTL,
+)
 from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
-from .entity import SectorAlarmBaseEntity
+from .entity import SectorAlarmBaseEntity, async_setup_device_entities
+from .model import Devices
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class CachedImage:
+    """A decoded camera image and the digest of its encoded data."""
+
+    fetched_at: float
+    digest: bytes
+    image: bytes
+
+
+class CameraImageCache:
+    """Cache of camera images shared by the cameras of a config entry.
+
+    Images are reused for ``ttl`` seconds, and concurrent requests for the
+    same camera share a single upstream fetch. When a fetch returns the
+    same response as the cached image it is not decoded again. The
+    total size of the decoded images is bounded, evicting the least
+    recently used camera first.
+    """
+
+    def __init__(self, api: SectorAlarmAPI, ttl: float, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self._api = api
+        self.ttl = ttl
+        self._max_bytes = max_bytes
+        self._images: OrderedDict[str, CachedImage] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[bytes | None]] = {}
+        self._total_bytes = 0
+
+    async def async_get(self, serial_no: str) -> bytes | None:
+        """Return the image of a camera, fetching it if the cached one is stale."""
+        cached = self._images.get(serial_no)
+        if cached is not None and time.monotonic() - cached.fetched_at < self.ttl:
+            self._images.move_to_end(serial_no)
+            return cached.image
+
+        if (future := self._pending.get(serial_no)) is None:
+            future = asyncio.ensure_future(self._async_fetch(serial_no))
+            self._pending[serial_no] = future
+            future.add_done_callback(lambda _: self._pending.pop(serial_no, None))
+        return await asyncio.shield(future)
+
+    async def _async_fetch(self, serial_no: str) -> bytes | None:
+        """Fetch an image from the API and store it."""
+        cached = self._images.get(serial_no)
+        camera_image = await self._api.fetch_camera_image(
+            serial_no, cached.digest if cached else None
+        )
+        if camera_image is None:
+            # Serve the last known image rather than nothing
+            return cached.image if cached else None
+
+        if camera_image.image is None and cached is not None:
+            # Stored again, another camera may have evicted it meanwhile
+            cached.fetched_at = time.monotonic()
+            self._store(serial_no, cached)
+            return cached.image
+
+        image = camera_image.image
+        self._store(
+            serial_no, CachedImage(time.monotonic(), camera_image.digest, image)
+        )
+        return image
+
+    def _store(self, serial_no: str, entry: CachedImage) -> None:
+        """Store an image, evicting least recently used ones over the size bound."""
+        if (previous := self._images.pop(serial_no, None)) is not None:
+            self._total_bytes -= len(previous.image)
+        self._images[serial_no] = entry
+        self._total_bytes += len(entry.image)
+        while self._total_bytes > self._max_bytes and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self._total_bytes -= len(evicted.image)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: SectorAlarmConfigEntry,
@@ -21,26 +106,45 @@ async def async_setup_entry(
 ) -> None:
     """Set up Sector Alarm cameras."""
     coordinator: SectorDataUpdateCoordinator = entry.runtime_data
-    devices = coordinator.data.get("devices", {})
-    cameras = devices.get("cameras", [])
-    entities = []
-
-    for camera_data in cameras:
-        serial_no = str(camera_data.get("SerialNo") or camera_data.get("Serial"))
-        device_name = camera_data.get("Label", "Sector Camera")
-        entities.append(
-            SectorAlarmCamera(coordinator, serial_no, device_name, "Camera")
-        )
-        _LOGGER.debug(
-            "Added camera entity with serial: %s and name: %s",
-            serial_no,
-            device_name,
+    image_cache = CameraImageCache(
+        coordinator.api,
+        entry.options.get(CONF_CAMERA_IMAGE_TTL, DEFAULT_CAMERA_IMAGE_TTL),
+        CAMERA_IMAGE_CACHE_BYTES,
+    )
+
+    async def _async_options_updated(
+        hass: HomeAssistant, entry: SectorAlarmConfigEntry
+    ) -> None:
+        image_cache.ttl = entry.options.get(
+            CONF_CAMERA_IMAGE_TTL, DEFAULT_CAMERA_IMAGE_TTL
         )
 
-    if entities:
-        async_add_entities(entities)
-    else:
-        _LOGGER.debug("No camera entities to add.")
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
+    @callback
+    def _async_add_devices(devices: list[Devices]) -> None:
+        entities = []
+        for camera in devices:
+            if camera.model != "Camera":
+                continue
+            device_name = camera.name or "Sector Camera"
+            entities.append(
+                SectorAlarmCamera(
+                    coordinator, image_cache, camera.serial_no, device_name, "Camera"
+                )
+            )
+            _LOGGER.debug(
+                "Added camera entity with serial: %s and name: %s",
+                camera.serial_no,
+                device_name,
+            )
+
+        if entities:
+            async_add_entities(entities)
+        else:
+            _LOGGER.debug("No camera entities to add.")
+
+    async_setup_device_entities(hass, entry, _async_add_devices)
 
 
 class SectorAlarmCamera(SectorAlarmBaseEntity, Camera):
@@ -51,6 +155,7 @@ class SectorAlarmCamera(SectorAlarmBaseEntity, Camera):
     def __init__(
         self,
         coordinator: SectorDataUpdateCoordinator,
+        image_cache: CameraImageCache,
         serial_no: str,
         device_name: str,
         device_model: str | None,
@@ -58,6 +163,7 @@ class SectorAlarmCamera(SectorAlarmBaseEntity, Camera):
         """Initialize the camera entity with device info."""
         super().__init__(coordinator, serial_no, device_name, device_model)
         Camera.__init__(self)
+        self._image_cache = image_cache
         self._attr_unique_id = f"{self._serial_no}_camera"
         _LOGGER.debug(
             "SECTOR_CAMERA: Initialized camera entity for device %s",
@@ -68,8 +174,8 @@ class SectorAlarmCamera(SectorAlarmBaseEntity, Camera):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a still image response from the camera."""
-        _LOGGER.debug(
-            "SECTOR_CAMERA: Requesting image for device %s", self._attr_unique_id
-        )
-        image = await self.coordinator.api.get_camera_image(self._serial_no)
-        return image
+        if self._serial_no in self.coordinator.trace_serials:
+            _LOGGER.debug(
+                "SECTOR_CAMERA: Requesting image for device %s", self._attr_unique_id
+            )
+        return await self._image_cache.async_get(self._serial_no)
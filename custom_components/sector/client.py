@@ -4,44 +4,556 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import binascii
+import bisect
+import hashlib
+import json
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Any
 
 import aiohttp
 import async_timeout
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.ssl import get_default_context
 
 from .endpoints import get_action_endpoints, get_data_endpoints
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 10
+# Connection setup limits. Reads are bounded by the endpoint timeout of each
+# request alone, aiohttp's sock_read would also cut short the wait for the
+# response headers of slow endpoints.
+CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=5, sock_connect=5)
+# Connection pool settings for the dedicated session
+CONNECTIONS_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+# Only advertise brotli when aiohttp can decode it
+ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if find_spec("brotli") or find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+# Housecheck endpoints are known to respond slowly, give them more headroom
+ENDPOINT_TIMEOUTS = {
+    "Humidity": 20,
+    "Temperatures": 20,
+}
 
-class AuthenticationError(Exception):
+
+# Completed reads are shared with identical requests for this many seconds
+REQUEST_CACHE_TTL = 5
+# Camera responses larger than this (bytes) are decoded in the executor
+CAMERA_DECODE_EXECUTOR_THRESHOLD = 64 * 1024
+# Used when the token carries no readable expiry
+DEFAULT_TOKEN_LIFETIME = 3600
+# Refresh the token this many seconds before it expires, or half way
+# through the lifetime of a shorter lived token
+TOKEN_REFRESH_MARGIN = 300
+# Never schedule a background refresh sooner than this (seconds)
+MIN_TOKEN_REFRESH_DELAY = 30
+# Idempotent GET requests are tried this many times on transient errors
+RETRY_ATTEMPTS = 3
+# Backoff before the first retry, doubled per retry and capped (seconds)
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 4
+# An endpoint failing this many refreshes in a row is paused (seconds)
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN = 300
+# Request budget shared by all panels of an account: burst size and refill
+# rate (requests per second)
+RATE_LIMIT_CAPACITY = 30
+RATE_LIMIT_REFILL = 1.0
+# Tokens background polls leave for commands
+RATE_LIMIT_PRIORITY_RESERVE = 3
+# Pause after a 429 response without a Retry-After header (seconds)
+DEFAULT_RETRY_AFTER = 30
+# Upper bounds (seconds) of the endpoint latency histogram buckets
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class SectorAPIError(Exception):
+    """Base exception for failed Sector Alarm API requests."""
+
+
+class AuthenticationError(SectorAPIError):
     """Exception raised for authentication errors."""
 
 
+class RateLimitedError(SectorAPIError):
+    """The API asked us to slow down."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize with the delay from the Retry-After header, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TransientAPIError(SectorAPIError):
+    """A request failed in a way that may succeed when retried."""
+
+
+class PermanentAPIError(SectorAPIError):
+    """A request was rejected and retrying it will not help."""
+
+
+class CircuitOpenError(SectorAPIError):
+    """An endpoint is paused after repeated failures."""
+
+
+class CircuitBreaker:
+    """Pause calls to an endpoint that keeps failing.
+
+    After ``threshold`` consecutive failures the circuit opens and calls are
+    refused for ``cooldown`` seconds. The first call after that is a trial:
+    success closes the circuit, another failure opens it again.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while calls should be refused."""
+        return time.monotonic() < self.open_until
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self) -> bool:
+        """Count a failure, return True if it opened the circuit."""
+        self.failures += 1
+        if self.failures < self.threshold:
+            return False
+        self.open_until = time.monotonic() + self.cooldown
+        return True
+
+
+class RateLimiter:
+    """Token bucket limiting the requests of one account.
+
+    Background polls keep RATE_LIMIT_PRIORITY_RESERVE tokens for priority
+    requests and wait while one is queued, so commands go out first. A
+    Retry-After from the API pauses every request until it has passed.
+    """
+
+    def __init__(
+        self,
+        capacity: int = RATE_LIMIT_CAPACITY,
+        refill: float = RATE_LIMIT_REFILL,
+        reserve: int = RATE_LIMIT_PRIORITY_RESERVE,
+    ) -> None:
+        """Initialize a full bucket."""
+        self.capacity = capacity
+        self.refill = refill
+        self.reserve = reserve
+        self.tokens = float(capacity)
+        self.paused_until = 0.0
+        self.rate_limited = 0
+        self._updated = time.monotonic()
+        self._priority_waiting = 0
+
+    @property
+    def usage(self) -> float:
+        """Return the share of the budget in use, in percent."""
+        self._refill()
+        return round(100 * (1 - self.tokens / self.capacity), 1)
+
+    @property
+    def paused_for(self) -> float:
+        """Return the seconds left of a Retry-After pause."""
+        return max(0.0, self.paused_until - time.monotonic())
+
+    async def async_acquire(
+        self, priority: bool = False, timeout: float | None = None
+    ) -> None:
+        """Wait until a request may be sent and take a token for it.
+
+        Raises RateLimitedError, without waiting, once the wait would
+        outlast ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if priority:
+            self._priority_waiting += 1
+        try:
+            while (wait := self._try_acquire(priority)) > 0:
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    raise RateLimitedError(
+                        f"No request budget within {timeout:.1f} seconds",
+                        self.paused_for or None,
+                    )
+                await asyncio.sleep(wait)
+        finally:
+            if priority:
+                self._priority_waiting -= 1
+
+    def pause(self, retry_after: float | None) -> None:
+        """Hold all requests after the API answered 429."""
+        self.rate_limited += 1
+        delay = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+        self.paused_until = max(self.paused_until, time.monotonic() + delay)
+        _LOGGER.warning(
+            "Sector Alarm API is rate limiting, pausing for %.0f seconds", delay
+        )
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.refill
+        )
+        self._updated = now
+
+    def _try_acquire(self, priority: bool) -> float:
+        """Take a token and return 0, or return the seconds to wait first."""
+        if (paused_for := self.paused_for) > 0:
+            return paused_for
+        self._refill()
+        if not priority and self._priority_waiting:
+            # Let the queued command have the next token
+            return 1 / self.refill
+        needed = 1.0 if priority else 1.0 + self.reserve
+        if self.tokens < needed:
+            return (needed - self.tokens) / self.refill
+        self.tokens -= 1
+        return 0
+
+
+class EndpointMetrics:
+    """Request statistics of one data endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.requests = 0
+        self.errors = 0
+        self.last_error: str | None = None
+        self.latency: float | None = None
+        self.latency_total = 0.0
+        # Requests per LATENCY_BUCKETS bucket, plus one for slower requests
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.payload_bytes: int | None = None
+        # Seconds spent decoding the last response body
+        self.decode_time: float | None = None
+        # Wall clock time of the last successful request
+        self.last_success: float | None = None
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean latency in seconds."""
+        return self.latency_total / self.requests if self.requests else None
+
+    @property
+    def since_last_success(self) -> float | None:
+        """Return the seconds since the last successful request."""
+        if self.last_success is None:
+            return None
+        return time.time() - self.last_success
+
+    def record(
+        self,
+        latency: float,
+        error: Exception | None = None,
+        payload_bytes: int | None = None,
+        decode_time: float | None = None,
+    ) -> None:
+        """Record a finished request."""
+        self.requests += 1
+        self.latency = latency
+        self.latency_total += latency
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if error is not None:
+            self.errors += 1
+            # The message holds the URL with the panel id, keep only the type
+            self.last_error = type(error).__name__
+            return
+        self.last_success = time.time()
+        if payload_bytes is not None:
+            self.payload_bytes = payload_bytes
+            self.decode_time = decode_time
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as JSON serializable data."""
+        histogram = {
+            f"<={bound}s": count
+            for bound, count in zip(LATENCY_BUCKETS, self.histogram, strict=False)
+        }
+        histogram[f">{LATENCY_BUCKETS[-1]}s"] = self.histogram[-1]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "latency": _round(self.latency),
+            "mean_latency": _round(self.mean_latency),
+            "latency_histogram": histogram,
+            "payload_bytes": self.payload_bytes,
+            "decode_time": _round(self.decode_time),
+            "since_last_success": _round(self.since_last_success),
+        }
+
+
+def _round(value: float | None) -> float | None:
+    """Round seconds to milliseconds for display."""
+    return round(value, 3) if value is not None else None
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds from a Retry-After header."""
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        # HTTP-date form, not used by the Sector API
+        return None
+
+
+@dataclass(slots=True)
+class CameraImage:
+    """A camera image response.
+
+    ``image`` is None when the response matched ``known_digest`` and was
+    not decoded.
+    """
+
+    digest: bytes
+    image: bytes | None
+    decode_time: float = 0.0
+    peak_bytes: int = 0
+
+
+def _decode_camera_image(body: bytes, known_digest: bytes | None) -> CameraImage:
+    """Parse a GetCameraImage response and decode its image.
+
+    The digest is taken over the raw body so an unchanged image is
+    detected before any parsing. The base64 data is decoded straight from
+    the parsed string, without an intermediate bytes copy.
+    """
+    start = time.perf_counter()
+    digest = hashlib.blake2b(body, digest_size=16).digest()
+    if digest == known_digest:
+        return CameraImage(digest, None, time.perf_counter() - start, len(body))
+
+    data = json.loads(body)
+    if not isinstance(data, dict):
+        raise ValueError("Response is not a JSON object")
+    image_data = data.get("ImageData")
+    if not image_data or not isinstance(image_data, str):
+        raise ValueError("Response has no ImageData")
+    image = binascii.a2b_base64(image_data)
+    # Body, encoded string and decoded image are all alive at this point
+    peak_bytes = len(body) + len(image_data) + len(image)
+    return CameraImage(digest, image, time.perf_counter() - start, peak_bytes)
+
+
+def _token_lifetime(token: str) -> float:
+    """Return the remaining lifetime in seconds of a JWT access token."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"]) - time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        return DEFAULT_TOKEN_LIFETIME
+
+
+class TokenManager:
+    """Cache the access token and refresh it before it expires.
+
+    Logins are single-flight: concurrent callers needing a new token wait
+    for the login already in progress instead of starting their own.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        login: Callable[[], Awaitable[str]],
+        refresh_ahead: bool = False,
+    ) -> None:
+        """Initialize the token manager."""
+        self.hass = hass
+        self._login = login
+        self._refresh_ahead = refresh_ahead
+        self._lock = asyncio.Lock()
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self.token: str | None = None
+        self.expires_at = 0.0
+        self._refresh_margin = float(TOKEN_REFRESH_MARGIN)
+
+    @property
+    def is_valid(self) -> bool:
+        """Return True if the cached token is not about to expire."""
+        return (
+            self.token is not None
+            and time.monotonic() < self.expires_at - self._refresh_margin
+        )
+
+    async def async_get_token(self) -> str:
+        """Return a valid token, logging in if needed."""
+        if self.is_valid:
+            return self.token
+        return await self.async_refresh(self.token)
+
+    async def async_refresh(self, stale_token: str | None = None) -> str:
+        """Log in and return the new token.
+
+        If another caller already replaced ``stale_token`` while we waited
+        for the lock, that token is returned without logging in again.
+        """
+        async with self._lock:
+            if self.token is not None and self.token != stale_token and self.is_valid:
+                return self.token
+
+            token = await self._login()
+            lifetime = _token_lifetime(token)
+            if lifetime <= 0:
+                # Already expired by our clock, likely clock skew against exp
+                lifetime = DEFAULT_TOKEN_LIFETIME
+            self.token = token
+            self.expires_at = time.monotonic() + lifetime
+            # A short lived token is still reused for half its lifetime
+            self._refresh_margin = min(TOKEN_REFRESH_MARGIN, lifetime / 2)
+            _LOGGER.debug("Obtained new access token valid for %.0fs", lifetime)
+            self._schedule_refresh(lifetime)
+            return token
+
+    @callback
+    def _schedule_refresh(self, lifetime: float) -> None:
+        """Schedule a background refresh ahead of expiry."""
+        if not self._refresh_ahead:
+            return
+        if self._unsub_refresh:
+            self._unsub_refresh()
+        self._unsub_refresh = async_call_later(
+            self.hass,
+            max(lifetime - self._refresh_margin, MIN_TOKEN_REFRESH_DELAY),
+            self._handle_refresh,
+        )
+
+    @callback
+    def _handle_refresh(self, _now: Any) -> None:
+        """Start a background token refresh."""
+        self._unsub_refresh = None
+        self.hass.async_create_background_task(
+            self._async_background_refresh(), "sector token refresh"
+        )
+
+    async def _async_background_refresh(self) -> None:
+        """Refresh the token, leaving recovery to the next request on failure."""
+        try:
+            await self.async_refresh(self.token)
+        except AuthenticationError as err:
+            _LOGGER.warning("Background token refresh failed: %s", err)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh."""
+        if self._unsub_refresh:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session with a connection pool tuned for the Sector API."""
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONNECTIONS_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        ssl=get_default_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=CLIENT_TIMEOUT,
+        headers={"Accept-Encoding": ACCEPT_ENCODING},
+    )
+
+
 class SectorAlarmAPI:
     """Class to interact with the Sector Alarm API."""
 
     API_URL = "https://mypagesapi.sectoralarm.net"
 
-    def __init__(self, hass: HomeAssistant, email, password, panel_id):
-        """Initialize the API client."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        email,
+        password,
+        panel_id,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        endpoint_timeouts: dict[str, float] | None = None,
+        refresh_token_ahead: bool = False,
+        dedicated_session: bool = False,
+        account: SectorAlarmAPI | None = None,
+        api_url: str | None = None,
+    ):
+        """Initialize the API client.
+
+        With ``account`` the session, access token and rate limiter of that
+        client are shared instead of creating new ones. ``api_url`` replaces
+        the Sector Alarm API, for example with a local stand-in.
+        """
         self.hass = hass
+        if api_url is not None:
+            self.API_URL = api_url
+        elif account is not None:
+            self.API_URL = account.API_URL
         self.email = email
         self.password = password
         self.panel_id = panel_id
-        self.access_token = None
-        self.headers: dict[str, str] = {}
-        self.session = None
-        self.data_endpoints = get_data_endpoints(self.panel_id)
-        self.action_endpoints = get_action_endpoints()
+        self._account = account
+        if account is not None:
+            self._owns_session = False
+            self.session = account.session
+            self.token_manager = account.token_manager
+            self.rate_limiter = account.rate_limiter
+        else:
+            self._owns_session = dedicated_session
+            self.session = (
+                create_session() if dedicated_session else async_get_clientsession(hass)
+            )
+            self.token_manager = TokenManager(
+                hass, self._async_login, refresh_token_ahead
+            )
+            self.rate_limiter = RateLimiter()
+        self.data_endpoints = get_data_endpoints(self.panel_id, self.API_URL)
+        self.action_endpoints = get_action_endpoints(self.API_URL)
+        self.endpoint_timeouts = endpoint_timeouts or ENDPOINT_TIMEOUTS
+        self.endpoint_metrics: dict[str, EndpointMetrics] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._inflight: dict[tuple[str, str, str], asyncio.Future[Any]] = {}
+        self._recent: dict[tuple[str, str, str], tuple[float, Any]] = {}
+        # Bumped by every command, reads started before it are not cached
+        self._generation = 0
+        self.requests_saved = 0
+
+    @property
+    def access_token(self) -> str | None:
+        """Return the current access token."""
+        return self.token_manager.token
 
     async def login(self):
         """Authenticate with the API and obtain an access token."""
-        if self.session is None:
-            self.session = async_get_clientsession(self.hass)
+        await self.token_manager.async_refresh(self.token_manager.token)
 
+    async def _async_login(self) -> str:
+        """Perform the login request and return the access token."""
         login_url = f"{self.API_URL}/api/Login/Login"
         payload = {
             "userId": self.email,
@@ -49,21 +561,20 @@ class SectorAlarmAPI:
         }
         try:
             async with async_timeout.timeout(10):
-                async with self.session.post(login_url, json=payload) as response:
+                async with self.session.post(
+                    login_url, json=payload, timeout=CLIENT_TIMEOUT
+                ) as response:
                     if response.status != 200:
                         _LOGGER.error(
                             "Login failed with status code %s", response.status
                         )
                         raise AuthenticationError("Invalid credentials")
                     data = await response.json()
-                    self.access_token = data.get("AuthorizationToken")
-                    if not self.access_token:
+                    access_token = data.get("AuthorizationToken")
+                    if not access_token:
                         _LOGGER.error("Login failed: No access token received")
                         raise AuthenticationError("Invalid credentials")
-                    self.headers = {
-                        "Authorization": f"Bearer {self.access_token}",
-                        "Accept": "application/json",
-                    }
+                    return access_token
 
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout occurred during login")
@@ -76,8 +587,13 @@ class SectorAlarmAPI:
         """Retrieve available panels from the API."""
         data = {}
         panellist_url = f"{self.API_URL}/api/account/GetPanelList"
-        response = await self._get(panellist_url)
-        _LOGGER.debug(f"panel_payload: {response}")
+        try:
+            response = await self._request("GET", panellist_url)
+        except (PermanentAPIError, RateLimitedError, TransientAPIError) as err:
+            _LOGGER.error("Failed to retrieve panels: %s", err)
+            return data
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Retrieved %d panels", len(response or []))
 
         if response:
             data = {
@@ -90,105 +606,369 @@ class SectorAlarmAPI:
 
         return data
 
-    async def retrieve_all_data(self):
-        """Retrieve all relevant data from the API."""
-        data = {}
+    async def retrieve_all_data(
+        self, endpoints: Iterable[str] | None = None, use_cache: bool = True
+    ) -> dict[str, Any]:
+        """Retrieve all relevant data from the API.
 
-        # Iterate over data endpoints
-        for key, (method, url) in self.data_endpoints.items():
-            if method == "GET":
-                response = await self._get(url)
-            elif method == "POST":
-                # For POST requests, we need to provide the panel ID in the payload
-                payload = {"PanelId": self.panel_id}
-                response = await self._post(url, payload)
-            else:
-                _LOGGER.error("Unsupported HTTP method %s for endpoint %s", method, key)
-                continue
+        All data endpoints, or only those named in ``endpoints``, are
+        requested concurrently, bounded by the concurrency limit. Endpoints
+        that fail or time out are left out of the result so the rest of the
+        data can still be used. Without ``use_cache`` recent results are not
+        reused, requests in flight still are.
+        """
+        start = time.monotonic()
+        keys = list(self.data_endpoints if endpoints is None else endpoints)
+        results = await asyncio.gather(
+            *(
+                self._fetch_endpoint(key, *self.data_endpoints[key], use_cache)
+                for key in keys
+            ),
+            return_exceptions=True,
+        )
 
-            if response:
+        data = {}
+        for key, response in zip(keys, results, strict=True):
+            if isinstance(response, AuthenticationError):
+                raise response
+            if isinstance(response, CircuitOpenError):
+                _LOGGER.debug("Skipped %s: %s", key, response)
+            elif isinstance(response, Exception):
+                _LOGGER.error("Failed to retrieve %s: %s", key, response)
+            elif response is not None:
+                # Empty responses are kept, they tell there are no devices
                 data[key] = response
             else:
                 _LOGGER.info("No data retrieved for %s", key)
 
-        locks_status = await self.get_lock_status()
-        data["Lock Status"] = locks_status
+        fetched = [
+            (key, self.endpoint_metrics[key])
+            for key in keys
+            if key in self.endpoint_metrics
+        ]
+        if _LOGGER.isEnabledFor(logging.DEBUG) and fetched:
+            slowest, metrics = max(fetched, key=lambda item: item[1].latency or 0)
+            _LOGGER.debug(
+                "Retrieved %d/%d endpoints in %.3fs, slowest %s (%.3fs)",
+                len(data),
+                len(keys),
+                time.monotonic() - start,
+                slowest,
+                metrics.latency or 0,
+            )
 
         return data
 
-    async def get_lock_status(self):
-        """Retrieve the lock status."""
-        url = f"{self.API_URL}/api/panel/GetLockStatus?panelId={self.panel_id}"
-        response = await self._get(url)
-        if response:
-            return response
+    async def _fetch_endpoint(
+        self, key: str, method: str, url: str, use_cache: bool = True
+    ) -> Any:
+        """Fetch a single data endpoint.
+
+        Network requests made for it are recorded in its metrics, results
+        shared with other calls are not. Raises CircuitOpenError without a
+        request while the endpoint is paused after repeated failures.
+        """
+        if method == "GET":
+            payload = None
+        elif method == "POST":
+            # For POST requests, we need to provide the panel ID in the payload
+            payload = {"PanelId": self.panel_id}
+        else:
+            _LOGGER.error("Unsupported HTTP method %s for endpoint %s", method, key)
+            return None
+
+        breaker = self._breakers.setdefault(key, CircuitBreaker())
+        if breaker.is_open:
+            raise CircuitOpenError(f"{key} is paused after repeated failures")
+
+        timeout = self.endpoint_timeouts.get(key, DEFAULT_TIMEOUT)
+        metrics = self.endpoint_metrics.setdefault(key, EndpointMetrics())
+        async with self._semaphore:
+            try:
+                result = await self._request(
+                    method, url, payload, timeout, use_cache, metrics
+                )
+            except AuthenticationError:
+                # Not a failure of the endpoint, don't pause it
+                raise
+            except SectorAPIError:
+                if breaker.record_failure():
+                    _LOGGER.warning(
+                        "Pausing %s for %d seconds after %d failed requests",
+                        key,
+                        breaker.cooldown,
+                        breaker.failures,
+                    )
+                raise
+        breaker.record_success()
+        return result
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        use_cache: bool = True,
+        metrics: EndpointMetrics | None = None,
+    ) -> Any:
+        """Perform a read request, sharing identical in-flight and recent calls.
+
+        Requests with the same method, URL and payload are merged into one
+        network call while in flight, and a successful result is reused for
+        REQUEST_CACHE_TTL seconds so overlapping refreshes don't repeat it.
+        Without ``use_cache`` only calls in flight are shared.
+        """
+        key = (method, url, json.dumps(payload, sort_keys=True))
+        cached = self._recent.get(key) if use_cache else None
+        if cached is not None and time.monotonic() - cached[0] < REQUEST_CACHE_TTL:
+            self.requests_saved += 1
+            return cached[1]
+
+        if (future := self._inflight.get(key)) is None:
+            future = asyncio.ensure_future(
+                self._execute(method, url, payload, timeout, metrics=metrics)
+            )
+            self._inflight[key] = future
+            generation = self._generation
+            future.add_done_callback(
+                lambda fut: self._request_done(key, fut, generation)
+            )
         else:
-            _LOGGER.error("Failed to retrieve lock status")
-            return []
+            self.requests_saved += 1
+
+        # Shield so a timed out caller doesn't cancel the call for the others
+        return await asyncio.shield(future)
+
+    @callback
+    def _request_done(
+        self, key: tuple[str, str, str], future: asyncio.Future[Any], generation: int
+    ) -> None:
+        """Move a finished request from in-flight to the recent results.
+
+        A result is not kept when a command was sent while it was in flight,
+        it may predate the command.
+        """
+        self._inflight.pop(key, None)
+        now = time.monotonic()
+        for expired in [
+            k for k, (ts, _) in self._recent.items() if now - ts >= REQUEST_CACHE_TTL
+        ]:
+            del self._recent[expired]
+        if generation != self._generation:
+            return
+        if not future.cancelled() and future.exception() is None:
+            if (result := future.result()) is not None:
+                self._recent[key] = (now, result)
+
+    async def _command(self, url: str, payload: dict[str, Any]) -> Any:
+        """Send a command and drop cached reads so the next refresh is fresh.
+
+        Identical commands already in flight are merged, but a command is
+        never answered from the recent results.
+        """
+        key = ("POST", url, json.dumps(payload, sort_keys=True))
+        if (future := self._inflight.get(key)) is None:
+            future = asyncio.ensure_future(
+                self._execute("POST", url, payload, priority=True)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.requests_saved += 1
 
-    async def _get(self, url):
-        """Helper method to perform GET requests with timeout."""
         try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" in content_type:
-                            return await response.json()
-                        else:
-                            text = await response.text()
-                            _LOGGER.error(
-                                "Received non-JSON response from %s: %s", url, text
-                            )
-                            return None
-                    else:
-                        text = await response.text()
-                        _LOGGER.error(
-                            "GET request to %s failed with status code %s, response: %s",
-                            url,
-                            response.status,
-                            text,
-                        )
-                        return None
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout occurred during GET request to %s", url)
-            return None
-        except aiohttp.ClientError as e:
-            _LOGGER.error("Client error during GET request to %s: %s", url, str(e))
-            return None
+            return await asyncio.shield(future)
+        finally:
+            self._generation += 1
+            self._recent.clear()
 
-    async def _post(self, url, payload):
-        """Helper method to perform POST requests with timeout."""
+    def _auth_headers(self, token: str) -> dict[str, str]:
+        """Return request headers for the given access token."""
+        return {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+        }
+
+    async def _execute(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        raw: bool = False,
+        priority: bool = False,
+        metrics: EndpointMetrics | None = None,
+    ) -> Any:
+        """Perform a request and return its decoded JSON body.
+
+        Every attempt waits for the account rate limiter first, ``priority``
+        requests ahead of the others. GET requests are idempotent and are
+        retried on transient errors with jittered exponential backoff.
+        Commands are sent only once. ``timeout`` bounds the whole request,
+        waits for the rate limiter, retries and backoff included. Every
+        attempt is recorded in ``metrics`` when given.
+
+        Raises AuthenticationError, RateLimitedError, TransientAPIError or
+        PermanentAPIError.
+        """
+        attempts = RETRY_ATTEMPTS if method == "GET" else 1
+        attempt = 1
+        deadline = time.monotonic() + timeout
+        while True:
+            await self.rate_limiter.async_acquire(priority, deadline - time.monotonic())
+            if (remaining := deadline - time.monotonic()) <= 0:
+                raise TransientAPIError(f"Timeout during {method} request to {url}")
+            try:
+                return await self._attempt(
+                    method, url, payload, remaining, raw, metrics
+                )
+            except RateLimitedError as err:
+                self.rate_limiter.pause(err.retry_after)
+                raise
+            except TransientAPIError as err:
+                if attempt >= attempts:
+                    raise
+                delay = min(RETRY_BACKOFF * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+                delay *= random.uniform(0.5, 1.0)
+                if time.monotonic() + delay >= deadline:
+                    # No time left for another attempt
+                    raise
+                _LOGGER.debug("%s, retrying in %.1f seconds", err, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        timeout: float,
+        raw: bool,
+        metrics: EndpointMetrics | None = None,
+    ) -> Any:
+        """Perform a single request and record it in ``metrics`` if given."""
+        token = await self.token_manager.async_get_token()
+        start = time.monotonic()
         try:
-            async with async_timeout.timeout(10):
-                async with self.session.post(
-                    url, json=payload, headers=self.headers
+            result, size, decode_time = await self._send(
+                method, url, payload, timeout, raw, token
+            )
+        except SectorAPIError as err:
+            if metrics is not None:
+                metrics.record(time.monotonic() - start, err)
+            raise
+        if metrics is not None:
+            metrics.record(time.monotonic() - start, None, size, decode_time)
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        timeout: float,
+        raw: bool,
+        token: str,
+    ) -> tuple[Any, int, float | None]:
+        """Send a request, logging in again if the token is rejected.
+
+        Returns what _handle_response returns.
+        """
+        try:
+            async with async_timeout.timeout(timeout):
+                async with self.session.request(
+                    method,
+                    url,
+                    json=payload,
+                    headers=self._auth_headers(token),
+                    timeout=CLIENT_TIMEOUT,
                 ) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" in content_type:
-                            return await response.json()
-                        else:
-                            text = await response.text()
-                            _LOGGER.error(
-                                "Received non-JSON response from %s: %s", url, text
-                            )
-                            return None
-                    else:
-                        text = await response.text()
-                        _LOGGER.error(
-                            "POST request to %s failed with status code %s, response: %s",
+                    if response.status == 401:
+                        # Token was rejected, log in again and retry once
+                        token = await self.token_manager.async_refresh(token)
+                        async with self.session.request(
+                            method,
                             url,
-                            response.status,
-                            text,
-                        )
-                        return None
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout occurred during POST request to %s", url)
-            return None
+                            json=payload,
+                            headers=self._auth_headers(token),
+                            timeout=CLIENT_TIMEOUT,
+                        ) as retry_response:
+                            return await self._handle_response(
+                                method, url, retry_response, raw
+                            )
+                    return await self._handle_response(method, url, response, raw)
+        except asyncio.TimeoutError as err:
+            raise TransientAPIError(
+                f"Timeout during {method} request to {url}"
+            ) from err
         except aiohttp.ClientError as err:
-            _LOGGER.error("Client error during POST request to %s: %s", url, str(err))
-            return None
+            raise TransientAPIError(
+                f"Client error during {method} request to {url}: {err}"
+            ) from err
+
+    async def _handle_response(
+        self,
+        method: str,
+        url: str,
+        response: aiohttp.ClientResponse,
+        raw: bool = False,
+    ) -> tuple[Any, int, float | None]:
+        """Return the decoded JSON body of a response, or raise a typed error.
+
+        The body is returned with its size and the seconds spent decoding
+        it. With ``raw`` the undecoded JSON body is returned as bytes. An
+        empty body is returned as None. Error bodies are not read, only
+        their size is logged.
+        """
+        status = response.status
+        if status == 200:
+            content_type = response.headers.get("Content-Type", "")
+            if "application/json" in content_type:
+                body = await response.read()
+                if raw:
+                    return body, len(body), None
+                if not body.strip():
+                    return None, len(body), None
+                start = time.perf_counter()
+                try:
+                    data = json.loads(body)
+                except ValueError as err:
+                    raise PermanentAPIError(
+                        f"{method} request to {url} returned malformed JSON: {err}"
+                    ) from err
+                return data, len(body), time.perf_counter() - start
+            raise PermanentAPIError(
+                f"{method} request to {url} returned non-JSON {content_type!r}"
+            )
+
+        _LOGGER.debug(
+            "%s request to %s failed with status code %s, %s bytes",
+            method,
+            url,
+            status,
+            response.content_length,
+        )
+        message = f"{method} request to {url} failed with status code {status}"
+        if status == 429:
+            raise RateLimitedError(
+                message, _retry_after(response.headers.get("Retry-After"))
+            )
+        if status == 408 or status >= 500:
+            raise TransientAPIError(message)
+        # A 401 here was returned for a fresh token, so the account can't use
+        # this endpoint
+        raise PermanentAPIError(message)
+
+    async def _action(self, url: str, payload: dict[str, Any], action: str) -> bool:
+        """Send a command, return True if the API accepted it."""
+        try:
+            await self._command(url, payload)
+        except SectorAPIError as err:
+            _LOGGER.error("Failed to %s: %s", action, err)
+            return False
+        _LOGGER.debug("Command to %s succeeded", action)
+        return True
 
     async def arm_system(self, mode: str, code: str):
         """Arm the alarm system."""
@@ -202,13 +982,7 @@ class SectorAlarmAPI:
             "PanelCode": panel_code,
             "PanelId": self.panel_id,
         }
-        result = await self._post(url, payload)
-        if result is not None:
-            _LOGGER.debug("System armed successfully")
-            return True
-        else:
-            _LOGGER.error("Failed to arm system")
-            return False
+        return await self._action(url, payload, "arm system")
 
     async def disarm_system(self, code: str):
         """Disarm the alarm system."""
@@ -218,13 +992,7 @@ class SectorAlarmAPI:
             "PanelCode": panel_code,
             "PanelId": self.panel_id,
         }
-        result = await self._post(url, payload)
-        if result is not None:
-            _LOGGER.debug("System disarmed successfully")
-            return True
-        else:
-            _LOGGER.error("Failed to disarm system")
-            return False
+        return await self._action(url, payload, "disarm system")
 
     async def lock_door(self, serial_no: str, code: str):
         """Lock a specific door."""
@@ -236,13 +1004,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
-        result = await self._post(url, payload)
-        if result is not None:
-            _LOGGER.debug("Door %s locked successfully", serial_no)
-            return True
-        else:
-            _LOGGER.error("Failed to lock door %s", serial_no)
-            return False
+        return await self._action(url, payload, f"lock door {serial_no}")
 
     async def unlock_door(self, serial_no: str, code: str):
         """Unlock a specific door."""
@@ -254,13 +1016,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
-        result = await self._post(url, payload)
-        if result is not None:
-            _LOGGER.debug("Door %s unlocked successfully", serial_no)
-            return True
-        else:
-            _LOGGER.error("Failed to unlock door %s", serial_no)
-            return False
+        return await self._action(url, payload, f"unlock door {serial_no}")
 
     async def turn_on_smartplug(self, plug_id):
         """Turn on a smart plug."""
@@ -269,13 +1025,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "DeviceId": plug_id,
         }
-        result = await self._post(url, payload)
-        if result is not None:
-            _LOGGER.debug("Smart plug %s turned on successfully", plug_id)
-            return True
-        else:
-            _LOGGER.error("Failed to turn on smart plug %s", plug_id)
-            return False
+        return await self._action(url, payload, f"turn on smart plug {plug_id}")
 
     async def turn_off_smartplug(self, plug_id):
         """Turn off a smart plug."""
@@ -284,29 +1034,72 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "DeviceId": plug_id,
         }
-        result = await self._post(url, payload)
-        if result is not None:
-            _LOGGER.debug("Smart plug %s turned off successfully", plug_id)
-            return True
-        else:
-            _LOGGER.error("Failed to turn off smart plug %s", plug_id)
-            return False
+        return await self._action(url, payload, f"turn off smart plug {plug_id}")
 
     async def get_camera_image(self, serial_no):
         """Retrieve the latest image from a camera."""
+        if camera_image := await self.fetch_camera_image(serial_no):
+            return camera_image.image
+        return None
+
+    async def fetch_camera_image(
+        self, serial_no, known_digest: bytes | None = None
+    ) -> CameraImage | None:
+        """Retrieve the latest image from a camera.
+
+        If the response is identical to the one ``known_digest`` was taken
+        from, it is not decoded and the returned image is None. Large
+        responses are parsed and decoded in the executor to keep the event
+        loop free.
+        """
         url = f"{self.API_URL}/api/camera/GetCameraImage"
         payload = {
             "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
-        response = await self._post(url, payload)
-        if response and response.get("ImageData"):
-            image_data = base64.b64decode(response["ImageData"])
-            return image_data
-        _LOGGER.error("Failed to retrieve image for camera %s", serial_no)
-        return None
+        try:
+            body = await self._execute("POST", url, payload, raw=True)
+        except SectorAPIError as err:
+            _LOGGER.error("Failed to retrieve image for camera %s: %s", serial_no, err)
+            return None
+
+        try:
+            if len(body) > CAMERA_DECODE_EXECUTOR_THRESHOLD:
+                camera_image = await self.hass.async_add_executor_job(
+                    _decode_camera_image, body, known_digest
+                )
+            else:
+                camera_image = _decode_camera_image(body, known_digest)
+        except (binascii.Error, ValueError) as err:
+            _LOGGER.error("Failed to decode image for camera %s: %s", serial_no, err)
+            return None
+
+        _LOGGER.debug(
+            "Camera %s image: %d bytes received, %s, decode %.1f ms, peak %d bytes",
+            serial_no,
+            len(body),
+            "unchanged" if camera_image.image is None else "decoded",
+            camera_image.decode_time * 1000,
+            camera_image.peak_bytes,
+        )
+        return camera_image
+
+    async def async_close(self) -> None:
+        """Stop the token refresh and close a dedicated session.
+
+        Does nothing for a client sharing the account of another one.
+        """
+        if self._account is not None:
+            return
+        self.token_manager.async_shutdown()
+        if self._owns_session:
+            await self.session.close()
 
     async def logout(self):
         """Logout from the API."""
         logout_url = f"{self.API_URL}/api/Login/Logout"
-        await self._post(logout_url, {})
+        try:
+            await self._execute("POST", logout_url, {})
+        except SectorAPIError as err:
+            _LOGGER.debug("Logout failed: %s", err)
+        self.token_manager.async_shutdown()
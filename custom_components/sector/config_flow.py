@@ -8,12 +8,16 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import (
+    ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
+    OptionsFlow,
     OptionsFlowWithConfigEntry,
 )
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -27,7 +31,19 @@ from homeassistant.helpers.selector import (
 )
 
 from .client import AuthenticationError, SectorAlarmAPI
-from .const import CONF_CODE_FORMAT, CONF_PANEL_ID, DOMAIN
+from .const import (
+    CONF_CAMERA_IMAGE_TTL,
+    CONF_CODE_FORMAT,
+    CONF_DEBUG_SERIALS,
+    CONF_DEDICATED_SESSION,
+    CONF_HOUSECHECK_INTERVAL,
+    CONF_PANEL_ID,
+    CONF_SENSOR_INTERVAL,
+    CONF_STATUS_INTERVAL,
+    DEFAULT_CAMERA_IMAGE_TTL,
+    DEFAULT_INTERVALS,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,6 +66,57 @@ DATA_SCHEMA_OPTIONS = vol.Schema(
         ),
     }
 )
+DATA_SCHEMA_INTERVALS = vol.Schema(
+    {
+        vol.Optional(
+            CONF_STATUS_INTERVAL, default=DEFAULT_INTERVALS[CONF_STATUS_INTERVAL]
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=10,
+                max=300,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            )
+        ),
+        vol.Optional(
+            CONF_SENSOR_INTERVAL, default=DEFAULT_INTERVALS[CONF_SENSOR_INTERVAL]
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=10,
+                max=3600,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            )
+        ),
+        vol.Optional(
+            CONF_HOUSECHECK_INTERVAL,
+            default=DEFAULT_INTERVALS[CONF_HOUSECHECK_INTERVAL],
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=10,
+                max=86400,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            )
+        ),
+        vol.Optional(
+            CONF_CAMERA_IMAGE_TTL, default=DEFAULT_CAMERA_IMAGE_TTL
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            )
+        ),
+        vol.Optional(CONF_DEDICATED_SESSION, default=False): BooleanSelector(),
+        vol.Optional(CONF_DEBUG_SERIALS, default=""): TextSelector(),
+    }
+)
 
 
 class SectorAlarmConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -63,6 +130,12 @@ class SectorAlarmConfigFlow(ConfigFlow, domain=DOMAIN):
         self.code_format: int | None
         self.panel_ids: dict[str, str]
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return SectorAlarmOptionsFlow(config_entry)
+
     async def async_step_reauth(
         self, entry_data: Mapping[str, Any]
     ) -> ConfigFlowResult:
@@ -116,7 +189,7 @@ class SectorAlarmConfigFlow(ConfigFlow, domain=DOMAIN):
                 panel_list = await api.get_panel_list()
 
                 self.panel_ids = panel_list
-                _LOGGER.debug(f"panel_ids: {self.panel_ids}")
+                _LOGGER.debug("Found panels: %s", list(self.panel_ids))
                 if not self.panel_ids:
                     errors["base"] = "no_panels_found"
                 elif len(self.panel_ids) == 1:
@@ -200,7 +273,7 @@ class SectorAlarmOptionsFlow(OptionsFlowWithConfigEntry):
         return self.async_show_form(
             step_id="init",
             data_schema=self.add_suggested_values_to_schema(
-                DATA_SCHEMA_OPTIONS,
+                DATA_SCHEMA_OPTIONS.extend(DATA_SCHEMA_INTERVALS.schema),
                 self.config_entry.options,
             ),
         )
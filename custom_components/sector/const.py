@@ -7,10 +7,23 @@ PLATFORMS = [
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
     Platform.CAMERA,
+    Platform.EVENT,
     Platform.LOCK,
     Platform.SENSOR,
     Platform.SWITCH,
 ]
+# Platforms set up for every panel, the others only once a device of a
+# model using them is found
+BASE_PLATFORMS = {
+    Platform.ALARM_CONTROL_PANEL,
+    Platform.BINARY_SENSOR,
+    Platform.SENSOR,
+}
+MODEL_PLATFORMS = {
+    "Camera": {Platform.CAMERA},
+    "Smart Lock": {Platform.EVENT, Platform.LOCK},
+    "Smart Plug": {Platform.SWITCH},
+}
 
 CATEGORY_MODEL_MAPPING = {
     "1": "Door/Window Sensor",
@@ -30,4 +43,45 @@ CATEGORY_MODEL_MAPPING = {
 }
 
 CONF_PANEL_ID = "panel_id"
+
+# Dispatcher signal with the serial numbers of devices found by a refresh,
+# formatted with the config entry id
+SIGNAL_NEW_DEVICES = f"{DOMAIN}_new_devices_{{}}"
 CONF_CODE_FORMAT = "code_format"
+
+# Panel device name when the panel list has no name for the panel
+DEFAULT_PANEL_NAME = "Sector Alarm Panel"
+
+CONF_STATUS_INTERVAL = "status_interval"
+CONF_SENSOR_INTERVAL = "sensor_interval"
+CONF_HOUSECHECK_INTERVAL = "housecheck_interval"
+
+# Default refresh interval in seconds for each polling tier
+DEFAULT_INTERVALS = {
+    CONF_STATUS_INTERVAL: 30,
+    CONF_SENSOR_INTERVAL: 60,
+    CONF_HOUSECHECK_INTERVAL: 600,
+}
+
+CONF_DEDICATED_SESSION = "dedicated_session"
+CONF_CAMERA_IMAGE_TTL = "camera_image_ttl"
+# Serial numbers logged in detail when debug logging is on
+CONF_DEBUG_SERIALS = "debug_serials"
+DEFAULT_CAMERA_IMAGE_TTL = 10
+# Upper bound on the decoded camera images kept in memory per entry
+CAMERA_IMAGE_CACHE_BYTES = 5 * 1024 * 1024
+
+# Polling tier of each data endpoint, the status tier sets the base tick
+ENDPOINT_INTERVALS = {
+    "Panel Status": CONF_STATUS_INTERVAL,
+    "Lock Status": CONF_STATUS_INTERVAL,
+    "Smartplug Status": CONF_STATUS_INTERVAL,
+    "Doors and Windows": CONF_SENSOR_INTERVAL,
+    "Leakage Detectors": CONF_SENSOR_INTERVAL,
+    "Smoke Detectors": CONF_SENSOR_INTERVAL,
+    "Logs": CONF_SENSOR_INTERVAL,
+    "Temperatures": CONF_HOUSECHECK_INTERVAL,
+    "Humidity": CONF_HOUSECHECK_INTERVAL,
+    "Persons": CONF_HOUSECHECK_INTERVAL,
+    "Cameras": CONF_HOUSECHECK_INTERVAL,
+}
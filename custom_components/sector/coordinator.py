@@ -1,247 +1,752 @@
 """Sector Alarm coordinator."""
 
 import logging
+import time
+from collections import deque
+from collections.abc import Callable, Collection, Mapping
+from contextlib import AbstractContextManager, nullcontext
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .client import AuthenticationError, SectorAlarmAPI
-from .const import CATEGORY_MODEL_MAPPING, CONF_PANEL_ID, DOMAIN
+from .client import AuthenticationError
+from .const import (
+    CATEGORY_MODEL_MAPPING,
+    CONF_DEBUG_SERIALS,
+    CONF_PANEL_ID,
+    CONF_STATUS_INTERVAL,
+    DEFAULT_INTERVALS,
+    DEFAULT_PANEL_NAME,
+    DOMAIN,
+    ENDPOINT_INTERVALS,
+    SIGNAL_NEW_DEVICES,
+)
+from .hub import SectorAccountHub
+from .model import Devices, Locks, PanelStatus, SectorData, SmartPlugs
+from .profiler import RefreshProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Poll status this often (seconds) right after a command or state change
+FAST_POLL_INTERVAL = 3
+# How long (seconds) to keep fast polling before backing off
+FAST_POLL_WINDOW = 30
+# Upper bound on API requests per minute, even while fast polling
+MAX_REQUESTS_PER_MINUTE = 60
+
+# Number of log entries kept per lock and event type
+LOG_HISTORY_SIZE = 50
+
+# Snapshot of the last data, used to set up entities at startup
+SNAPSHOT_STORAGE_VERSION = 1
+# Coalesce snapshot writes over this many seconds
+SNAPSHOT_SAVE_DELAY = 60
+
+# Sensor fields read from a component: (attribute, source keys, transform).
+# The first source key present wins.
+COMPONENT_FIELDS: tuple[tuple[str, tuple[str, ...], Callable[[Any], Any]], ...] = (
+    ("closed", ("Closed",), bool),
+    ("low_battery", ("LowBattery", "BatteryLow"), bool),
+    ("alarm", ("Alarm",), bool),
+    ("temperature", ("Temperature",), float),
+    ("humidity", ("Humidity",), float),
+)
+
+# Listener context of entities that read the panel status
+PANEL_STATUS_CONTEXT = "panel_status"
+# Listener context of diagnostic entities, updated on every refresh
+DIAGNOSTIC_CONTEXT = "diagnostic"
+
 # Make sure the SectorAlarmConfigEntry type is present
 type SectorAlarmConfigEntry = ConfigEntry[SectorDataUpdateCoordinator]
 
 
-class SectorDataUpdateCoordinator(DataUpdateCoordinator):
+def snapshot_storage_key(entry_id: str) -> str:
+    """Return the storage key of the snapshot of a config entry."""
+    return f"{DOMAIN}.{entry_id}"
+
+
+def parse_serials(value: str | None) -> frozenset[str]:
+    """Return the serial numbers in a comma or space separated option."""
+    return frozenset(value.replace(",", " ").split()) if value else frozenset()
+
+
+def normalize_component(component: dict[str, Any]) -> dict[str, Any]:
+    """Return the sensor values of a component in a single pass over COMPONENT_FIELDS."""
+    values: dict[str, Any] = {}
+    for attribute, source_keys, transform in COMPONENT_FIELDS:
+        for key in source_keys:
+            if key in component:
+                try:
+                    values[attribute] = transform(component[key])
+                except (TypeError, ValueError) as err:
+                    _LOGGER.warning(
+                        "Failed to transform value '%s' for key '%s': %s",
+                        component[key],
+                        key,
+                        err,
+                    )
+                break
+    return values
+
+
+class SectorDataUpdateCoordinator(DataUpdateCoordinator[SectorData]):
     """Coordinator to manage data fetching from Sector Alarm."""
 
     config_entry: SectorAlarmConfigEntry
 
-    def __init__(self, hass: HomeAssistant, entry: SectorAlarmConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: SectorAlarmConfigEntry,
+        hub: SectorAccountHub,
+    ) -> None:
         """Initialize the coordinator."""
         self.hass = hass
-        self.api = SectorAlarmAPI(
-            hass=hass,
-            email=entry.data[CONF_EMAIL],
-            password=entry.data[CONF_PASSWORD],
-            panel_id=entry.data[CONF_PANEL_ID],
+        self.hub = hub
+        self.api = hub.panel_api(entry.data[CONF_PANEL_ID])
+        self.panel_name = DEFAULT_PANEL_NAME
+        self._endpoint_intervals: dict[str, float] = {}
+        self._idle_interval = 0.0
+        self._set_intervals(entry.options)
+        # Devices logged in detail when debug logging is on
+        self.trace_serials = parse_serials(entry.options.get(CONF_DEBUG_SERIALS))
+        self._last_fetched: dict[str, float] = {}
+        self._api_data: dict[str, Any] = {}
+        self._poll_interval = self._idle_interval
+        self._fast_poll_until = 0.0
+        self._requests_per_refresh = 0
+        self._failed_endpoints: list[str] = []
+        self._status_signature: tuple | None = None
+        # Devices listed by an endpoint since startup, as opposed to devices
+        # only known from the snapshot
+        self._listed_serials: set[str] = set()
+        self._event_logs: dict[str, dict[str, deque[dict[str, str]]]] = {}
+        self._logs_payload: list[dict[str, Any]] | None = None
+        # After a restore, event entities exist before the log is fetched.
+        # The first log slice is then history that they mark seen without
+        # firing it, log_history_update is True while they are updated.
+        self._log_history_pending = False
+        self.log_history_update = False
+        self._log_high_water: str | None = None
+        self._log_keys_at_high_water: set[tuple] = set()
+        # Entries past the high-water mark whose lock isn't known yet
+        self._unmatched_log_entries: deque[dict[str, Any]] = deque(
+            maxlen=LOG_HISTORY_SIZE
+        )
+        self._changed_contexts: set[str] | None = None
+        self._new_devices: set[str] = set()
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(entry.entry_id)
         )
+        # True while the data comes from the snapshot, before a refresh
+        self.restored = False
+        # Platforms set up for the entry
+        self.platforms: list[Platform] = []
+        # Set while refresh cycles are being profiled
+        self.profiler: RefreshProfiler | None = None
         super().__init__(
             hass,
             _LOGGER,
             config_entry=entry,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),
+            update_interval=timedelta(seconds=self._idle_interval),
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Sector Alarm API."""
+    def _set_intervals(self, options: Mapping[str, Any]) -> None:
+        """Set the refresh interval of each endpoint from the interval options."""
+        intervals = {
+            tier: float(options.get(tier, default))
+            for tier, default in DEFAULT_INTERVALS.items()
+        }
+        self._endpoint_intervals = {
+            key: intervals[ENDPOINT_INTERVALS.get(key, CONF_STATUS_INTERVAL)]
+            for key in self.api.data_endpoints
+        }
+        self._idle_interval = intervals[CONF_STATUS_INTERVAL]
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply changed interval options without reloading the entry."""
+        self._set_intervals(self.config_entry.options)
+        self.trace_serials = parse_serials(
+            self.config_entry.options.get(CONF_DEBUG_SERIALS)
+        )
+        if time.monotonic() >= self._fast_poll_until:
+            self._poll_interval = self._idle_interval
+        self._update_poll_interval()
+
+    async def _async_setup(self) -> None:
+        """Look up the panel name in the panel list shared by the account."""
+        panels = await self.hub.async_get_panel_list()
+        self.panel_name = panels.get(self.api.panel_id) or DEFAULT_PANEL_NAME
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the snapshot saved by an earlier run, return True if found."""
+        if not (snapshot := await self._store.async_load()):
+            return False
+        self.data = SectorData.from_snapshot(snapshot, self._event_logs)
+        self.panel_name = snapshot.get("panel_name", self.panel_name)
+        self.restored = True
+        self._log_history_pending = True
+        _LOGGER.debug("Restored %d devices from snapshot", len(self.data.devices))
+        return True
+
+    async def async_refresh_restored(self) -> None:
+        """Replace restored data with fresh data, run in the background."""
         try:
-            await self.api.login()
-            api_data = await self.api.retrieve_all_data()
-            _LOGGER.debug("API ALL DATA: %s", api_data)
-
-            # Process devices and panel status
-            devices, panel_status = self._process_devices(api_data)
+            await self._async_setup()
+        except AuthenticationError as error:
+            _LOGGER.warning("Could not look up the panel name: %s", error)
+        await self.async_refresh()
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to save in the snapshot."""
+        return {"panel_name": self.panel_name, **self.data.as_snapshot()}
+
+    @callback
+    def async_start_profiling(self, cycles: int, cprofile: bool) -> RefreshProfiler:
+        """Profile the next ``cycles`` refreshes, return the profiler.
+
+        The profiler's ``done`` future completes after the last cycle.
+        """
+        self.profiler = RefreshProfiler(self.hass, cycles, cprofile)
+        return self.profiler
+
+    def _phase(self, name: str) -> AbstractContextManager[None]:
+        """Time a refresh phase while profiling."""
+        return self.profiler.phase(name) if self.profiler else nullcontext()
+
+    @callback
+    def _end_profile_cycle(self, error: Exception | None = None) -> None:
+        """Close the profiled cycle, stop profiling after the last one."""
+        if self.profiler is not None and self.profiler.end_cycle(error):
+            self.profiler = None
+
+    async def _async_update_data(self) -> SectorData:
+        """Fetch data from Sector Alarm API.
+
+        With debug logging on, one summary is logged per refresh and only
+        the devices in ``trace_serials`` are logged in detail.
+        """
+        if self.profiler is not None:
+            self.profiler.start_cycle()
+        start = time.monotonic()
+        try:
+            with self._phase("auth"):
+                await self.api.token_manager.async_get_token()
+            with self._phase("fetch"):
+                api_data = await self._async_fetch_due_endpoints()
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            trace = self.trace_serials if debug else frozenset()
+
+            status_signature = self._status_signature_from(api_data)
+            if self._status_signature not in (None, status_signature):
+                _LOGGER.debug("Status changed, polling fast")
+                self._start_fast_polling()
+            self._status_signature = status_signature
+            self._update_poll_interval()
+
+            # Devices and panel status are updated in place between refreshes
+            data = self.data or SectorData(
+                panel_status=PanelStatus(), logs=self._event_logs
+            )
+            known = set(data.devices)
+            # Until every endpoint has answered once, a restored device may
+            # only belong to an endpoint that failed
+            answered = self._api_data.keys() >= self._endpoint_intervals.keys()
+            with self._phase("devices"):
+                changed = self._process_devices(
+                    api_data, data, remove_unseen=answered, trace=trace
+                )
+            added = data.devices.keys() - known
+            self._new_devices |= added
+            if removed := known - data.devices.keys():
+                self._async_remove_devices(removed)
 
             # Process logs for event handling
             logs_data = api_data.get("Logs", [])
-            self._event_logs = self._process_event_logs(logs_data, devices)
+            events: set[str] = set()
+            self.log_history_update = False
+            if logs_data is not self._logs_payload or (
+                added and self._unmatched_log_entries
+            ):
+                # Only a freshly fetched log slice can hold new entries, or a
+                # new lock match entries held back
+                self._logs_payload = logs_data
+                with self._phase("logs"):
+                    events = self._process_event_logs(logs_data, data.devices, trace)
+                changed |= events
+                if "Logs" in api_data:
+                    self.log_history_update = self._log_history_pending
+                    self._log_history_pending = False
+
+            if self.data is None or self.restored or not self.last_update_success:
+                # First refresh, replacing restored data or recovering from a
+                # failure, update everyone
+                self._changed_contexts = None
+            else:
+                self._changed_contexts = changed | {DIAGNOSTIC_CONTEXT}
+            if changed or self.restored or self.data is None:
+                self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+            self.restored = False
 
-            return {
-                "devices": devices,
-                "panel_status": panel_status,
-                "logs": self._event_logs,
-            }
+            if debug:
+                _LOGGER.debug(
+                    "Refresh summary: endpoints=%d/%d failed=%s devices=%d "
+                    "changed=%d added=%d removed=%d locks_with_events=%d "
+                    "duration=%.3fs",
+                    self._requests_per_refresh,
+                    len(self._endpoint_intervals),
+                    self._failed_endpoints,
+                    len(data.devices),
+                    len(changed),
+                    len(added),
+                    len(removed),
+                    len(events),
+                    time.monotonic() - start,
+                )
+            return data
 
         except AuthenticationError as error:
+            self._end_profile_cycle(error)
             raise UpdateFailed(f"Authentication failed: {error}") from error
+        except UpdateFailed as error:
+            self._end_profile_cycle(error)
+            raise
         except Exception as error:
+            self._end_profile_cycle(error)
             _LOGGER.exception("Failed to update data")
             raise UpdateFailed(f"Failed to update data: {error}") from error
 
-    def _process_devices(self, api_data) -> tuple[dict[str, Any], dict[str, Any]]:
-        """Process device data from the API, including humidity, closed, and alarm sensors."""
-        devices: dict[str, Any] = {}
-        panel_status = api_data.get("Panel Status", {})
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose device changed in the last refresh.
+
+        Entities register with their serial number (or PANEL_STATUS_CONTEXT)
+        as listener context. DIAGNOSTIC_CONTEXT listeners are updated on
+        every refresh, as are listeners without a context.
+        """
+        with self._phase("listeners"):
+            self._async_update_listeners()
+        self._end_profile_cycle()
+
+    @callback
+    def _async_update_listeners(self) -> None:
+        """Dispatch new devices and update the listeners of changed contexts."""
+        if self._new_devices:
+            new_devices, self._new_devices = self._new_devices, set()
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_NEW_DEVICES.format(self.config_entry.entry_id),
+                new_devices,
+            )
+
+        changed = self._changed_contexts
+        self._changed_contexts = None
+        if changed is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Updating listeners of %d changed contexts", len(changed))
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    @callback
+    def _async_remove_devices(self, serials: set[str]) -> None:
+        """Remove devices no longer on the panel, with their entities."""
+        device_registry = dr.async_get(self.hass)
+        for serial_no in serials:
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, serial_no)}
+            ):
+                _LOGGER.debug("Removing device %s", serial_no)
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+    async def _async_fetch_due_endpoints(self) -> dict[str, Any]:
+        """Fetch the endpoints whose interval has elapsed.
+
+        Fresh slices are merged over the ones cached from earlier refreshes,
+        so the result always covers every endpoint fetched so far. Raises
+        UpdateFailed when no status endpoint answered, the cached status
+        would otherwise be shown as current.
+        """
+        now = time.monotonic()
+        due = [
+            key
+            for key, interval in self._endpoint_intervals.items()
+            if key not in self._last_fetched
+            or ENDPOINT_INTERVALS.get(key) == CONF_STATUS_INTERVAL
+            # Allow a little slack so timer jitter doesn't skip a whole tick
+            or now - self._last_fetched[key] >= interval - 1
+        ]
+        self._requests_per_refresh = len(due)
+        # The profiler may start or stop while the endpoints are fetched
+        if (profiler := self.profiler) is not None:
+            requests = {
+                key: metrics.requests
+                for key, metrics in self.api.endpoint_metrics.items()
+            }
+        # Fast polls come quicker than the read cache expires, don't let
+        # every other one be answered with the previous status
+        fresh = await self.api.retrieve_all_data(
+            due, use_cache=now >= self._fast_poll_until
+        )
+        # Failed endpoints stay due and are retried on the next refresh
+        for key in fresh:
+            self._last_fetched[key] = now
+        self._api_data.update(fresh)
+        self._failed_endpoints = [key for key in due if key not in fresh]
+        if profiler is not None:
+            # Endpoints answered from the cache or skipped by an open circuit
+            # made no request this cycle
+            for key in due:
+                metrics = self.api.endpoint_metrics.get(key)
+                if metrics is not None and metrics.requests > requests.get(key, 0):
+                    profiler.add(f"fetch {key}", metrics.latency)
+                    profiler.add(f"decode {key}", metrics.decode_time)
+        status_due = [
+            key for key in due if ENDPOINT_INTERVALS.get(key) == CONF_STATUS_INTERVAL
+        ]
+        if not fresh or (status_due and fresh.keys().isdisjoint(status_due)):
+            raise UpdateFailed(
+                f"No status retrieved, failed endpoints: {self._failed_endpoints}"
+            )
+        return self._api_data
+
+    async def async_request_fast_refresh(self) -> None:
+        """Refresh now and keep polling status fast until it settles.
+
+        Used after commands, since the panel rarely reports the new state
+        on the first refresh.
+        """
+        self._start_fast_polling()
+        self._update_poll_interval()
+        await self.async_request_refresh()
+
+    def _start_fast_polling(self) -> None:
+        """Open or extend the fast polling window."""
+        self._fast_poll_until = time.monotonic() + FAST_POLL_WINDOW
+        self._poll_interval = FAST_POLL_INTERVAL
+
+    def _update_poll_interval(self) -> None:
+        """Set the interval to the next refresh.
+
+        Inside the fast polling window status is polled every
+        FAST_POLL_INTERVAL seconds, afterwards the interval doubles on each
+        refresh until it is back at the idle interval.
+        """
+        if time.monotonic() >= self._fast_poll_until:
+            self._poll_interval = min(self._poll_interval * 2, self._idle_interval)
+
+        # Never exceed the request ceiling, whatever the mode
+        floor = 60 * self._requests_per_refresh / MAX_REQUESTS_PER_MINUTE
+        self.update_interval = timedelta(seconds=max(self._poll_interval, floor))
+
+    @staticmethod
+    def _status_signature_from(api_data: dict[str, Any]) -> tuple:
+        """Return the alarm, lock and smartplug states to detect changes."""
+        panel_status = api_data.get("Panel Status") or {}
+        return (
+            panel_status.get("Status"),
+            tuple(
+                (lock.get("Serial"), lock.get("Status"))
+                for lock in api_data.get("Lock Status") or []
+            ),
+            tuple(
+                (plug.get("Id"), plug.get("State", plug.get("Status")))
+                for plug in api_data.get("Smartplug Status") or []
+            ),
+        )
+
+    def _process_devices(
+        self,
+        api_data,
+        data: SectorData,
+        remove_unseen: bool = True,
+        trace: Collection[str] = (),
+    ) -> set[str]:
+        """Process device data from the API, including humidity, closed, and alarm sensors.
+
+        Devices and panel status in ``data`` are updated in place. A device
+        no longer in ``api_data`` is removed when an endpoint listed it
+        before, since that endpoint has answered without it. Other devices,
+        restored from the snapshot, are only removed if ``remove_unseen``.
+        Returns the serial numbers of devices that were added, changed or
+        removed, plus PANEL_STATUS_CONTEXT if the panel status changed.
+        Devices in ``trace`` are logged at debug level.
+        """
+        changed: set[str] = set()
+        seen: set[str] = set()
+        if data.panel_status.update_from_api(api_data.get("Panel Status", {})):
+            changed.add(PANEL_STATUS_CONTEXT)
 
         for category_name, category_data in api_data.items():
             if category_name in ["Logs", "Panel Status"]:
                 continue
 
-            _LOGGER.debug("Processing category: %s", category_name)
             if category_name == "Lock Status" and isinstance(category_data, list):
-                self._process_locks(category_data, devices)
+                self._process_locks(category_data, data.devices, seen, changed, trace)
+            elif category_name == "Smartplug Status" and isinstance(
+                category_data, list
+            ):
+                self._process_smartplugs(
+                    category_data, data.devices, seen, changed, trace
+                )
+            elif category_name == "Cameras" and isinstance(category_data, list):
+                self._process_cameras(category_data, data.devices, seen, changed)
             else:
-                self._process_category_devices(category_name, category_data, devices)
+                self._process_category_devices(
+                    category_name, category_data, data.devices, seen, changed, trace
+                )
+
+        for serial_no in data.devices.keys() - seen:
+            if remove_unseen or serial_no in self._listed_serials:
+                del data.devices[serial_no]
+                self._listed_serials.discard(serial_no)
+                changed.add(serial_no)
+        self._listed_serials |= seen
 
-        return devices, panel_status
+        data.update_index(changed - {PANEL_STATUS_CONTEXT})
+        return changed
 
-    def _process_locks(self, locks_data: list, devices: dict) -> None:
-        """Process lock data and add to devices dictionary."""
+    def _process_locks(
+        self,
+        locks_data: list,
+        devices: dict[str, Devices],
+        seen: set[str],
+        changed: set[str],
+        trace: Collection[str] = (),
+    ) -> None:
+        """Process lock data and update the devices dictionary."""
         for lock in locks_data:
             serial_no = str(lock.get("Serial"))
             if not serial_no:
                 _LOGGER.warning("Lock missing Serial: %s", lock)
                 continue
 
-            devices[serial_no] = {
+            seen.add(serial_no)
+            values = {
                 "name": lock.get("Label"),
-                "serial_no": serial_no,
-                "sensors": {
-                    "lock_status": lock.get("Status"),
-                    "low_battery": lock.get("BatteryLow"),
-                },
-                "model": "Smart Lock",
+                "lock_status": lock.get("Status"),
+                "low_battery": lock.get("BatteryLow"),
             }
-            _LOGGER.debug(
-                "Processed lock with serial_no %s: %s", serial_no, devices[serial_no]
-            )
+            device = devices.get(serial_no)
+            if isinstance(device, Locks):
+                if device.update(**values):
+                    changed.add(serial_no)
+            else:
+                devices[serial_no] = Locks(serial_no=serial_no, **values)
+                changed.add(serial_no)
+            if serial_no in trace:
+                _LOGGER.debug("Processed lock %s: %s", serial_no, devices[serial_no])
 
-    def _process_category_devices(
-        self, category_name: str, category_data: dict, devices: dict
+    def _process_smartplugs(
+        self,
+        plugs_data: list,
+        devices: dict[str, Devices],
+        seen: set[str],
+        changed: set[str],
+        trace: Collection[str] = (),
     ) -> None:
-        """Process devices within a specific category and add them to devices dictionary."""
-        default_model_name = CATEGORY_MODEL_MAPPING.get(category_name, category_name)
-
-        if isinstance(category_data, dict) and "Sections" in category_data:
-            for section in category_data["Sections"]:
-                for place in section.get("Places", []):
-                    for component in place.get("Components", []):
-                        serial_no = str(
-                            component.get("SerialNo") or component.get("Serial")
-                        )
-                        if serial_no:
-                            device_type = str(component.get("Type", "")).lower()
-                            model_name = CATEGORY_MODEL_MAPPING.get(
-                                device_type, default_model_name
-                            )
-
-                            # Initialize or update device entry with sensors
-                            device_info = devices.setdefault(
-                                serial_no,
-                                {
-                                    "name": component.get("Label")
-                                    or component.get("Name"),
-                                    "serial_no": serial_no,
-                                    "sensors": {},
-                                    "model": model_name,
-                                    "type": component.get("Type", ""),
-                                },
-                            )
-
-                            # Add or update each sensor in the device
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "closed",
-                                "Closed",
-                                bool,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "low_battery",
-                                ["LowBattery", "BatteryLow"],
-                                bool,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "alarm",
-                                "Alarm",
-                                bool,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "temperature",
-                                "Temperature",
-                                float,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "humidity",
-                                "Humidity",
-                                float,
-                            )
-
-                            _LOGGER.debug(
-                                "Processed device %s with model: %s, category: %s, type: %s",
-                                serial_no,
-                                model_name,
-                                category_name,
-                                device_type,
-                            )
-                        else:
-                            _LOGGER.warning(
-                                "Component missing SerialNo/Serial: %s", component
-                            )
-        else:
-            _LOGGER.debug("Category %s does not contain Sections.", category_name)
-
-    def _add_sensor_if_present(
+        """Process smart plug data and update the devices dictionary."""
+        for plug in plugs_data:
+            serial = plug.get("SerialNo") or plug.get("Serial") or plug.get("Id")
+            if not serial:
+                _LOGGER.warning("Smart plug missing SerialNo/Id: %s", plug)
+                continue
+
+            serial_no = str(serial)
+            seen.add(serial_no)
+            values = {
+                "name": plug.get("Label") or "Sector Smart Plug",
+                "plug_id": plug.get("Id"),
+                "is_on": plug.get("State", plug.get("Status")) == "On",
+            }
+            device = devices.get(serial_no)
+            if isinstance(device, SmartPlugs):
+                if device.update(**values):
+                    changed.add(serial_no)
+            else:
+                devices[serial_no] = SmartPlugs(serial_no=serial_no, **values)
+                changed.add(serial_no)
+            if serial_no in trace:
+                _LOGGER.debug(
+                    "Processed smart plug %s: %s", serial_no, devices[serial_no]
+                )
+
+    def _process_cameras(
         self,
-        sensors: dict,
-        component: dict,
-        sensor_key: str,
-        source_keys: Any,
-        transform: type | None = None,
-    ):
-        """Add a sensor to the sensors dictionary if it exists in component."""
-        if isinstance(source_keys, str):
-            source_keys = [source_keys]
+        cameras_data: list,
+        devices: dict[str, Devices],
+        seen: set[str],
+        changed: set[str],
+    ) -> None:
+        """Process a flat camera list and update the devices dictionary."""
+        for camera in cameras_data:
+            serial = camera.get("SerialNo") or camera.get("Serial")
+            if not serial:
+                _LOGGER.warning("Camera missing SerialNo/Serial: %s", camera)
+                continue
 
-        for key in source_keys:
-            if key in component:
-                value = component[key]
-                if transform:
-                    try:
-                        value = transform(value)
-                    except ValueError as e:
+            serial_no = str(serial)
+            seen.add(serial_no)
+            name = camera.get("Label") or camera.get("Name") or "Sector Camera"
+            device = devices.get(serial_no)
+            if device is None:
+                devices[serial_no] = Devices(
+                    name=name, serial_no=serial_no, model="Camera", type="camera"
+                )
+                changed.add(serial_no)
+            elif device.update(name=name):
+                changed.add(serial_no)
+
+    @staticmethod
+    def _process_category_devices(
+        category_name: str,
+        category_data: dict,
+        devices: dict[str, Devices],
+        seen: set[str],
+        changed: set[str],
+        trace: Collection[str] = (),
+    ) -> None:
+        """Process devices within a specific category and update the devices dictionary."""
+        default_model_name = CATEGORY_MODEL_MAPPING.get(
+            category_name.lower(), category_name
+        )
+
+        if not isinstance(category_data, dict) or "Sections" not in category_data:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Category %s does not contain Sections.", category_name)
+            return
+
+        for section in category_data["Sections"]:
+            for place in section.get("Places", []):
+                for component in place.get("Components", []):
+                    serial = component.get("SerialNo") or component.get("Serial")
+                    if not serial:
                         _LOGGER.warning(
-                            "Failed to transform value '%s' for key '%s': %s",
-                            value,
-                            key,
-                            e,
+                            "Component missing SerialNo/Serial: %s", component
+                        )
+                        continue
+
+                    serial_no = str(serial)
+                    device = devices.get(serial_no)
+                    values = normalize_component(component)
+                    if serial_no not in seen and not isinstance(device, Locks):
+                        # First category seeing the device sets its identity
+                        device_type = component.get("Type", "")
+                        values["name"] = component.get("Label") or component.get("Name")
+                        values["model"] = CATEGORY_MODEL_MAPPING.get(
+                            str(device_type).lower(), default_model_name
+                        )
+                        values["type"] = device_type
+
+                    seen.add(serial_no)
+                    if device is None:
+                        devices[serial_no] = Devices(serial_no=serial_no, **values)
+                        changed.add(serial_no)
+                    elif device.update(**values):
+                        changed.add(serial_no)
+
+                    if serial_no in trace:
+                        _LOGGER.debug(
+                            "Processed device %s in category %s: %s",
+                            serial_no,
+                            category_name,
+                            values,
                         )
-                        return  # Skip adding this sensor if transformation fails
-
-                # Add sensor to the dictionary if found and transformed successfully
-                sensors[sensor_key] = value
-                _LOGGER.debug(
-                    "Successfully added sensor '%s' with value '%s' to sensors",
-                    sensor_key,
-                    value,
-                )
-                return  # Exit after the first match to avoid overwriting
 
-        # Log a debug message if none of the source keys are found
-        _LOGGER.debug(
-            "Sensor keys %s were not found in component for sensor '%s'",
-            source_keys,
-            sensor_key,
+    @staticmethod
+    def _log_key(log_entry: dict[str, Any]) -> tuple:
+        """Return a key identifying a log entry."""
+        return (
+            log_entry.get("Time"),
+            log_entry.get("LockName"),
+            log_entry.get("EventType"),
+            log_entry.get("User"),
+            log_entry.get("Channel"),
         )
 
-    def _process_event_logs(self, logs, devices):
-        """Process event logs, associating them with the correct lock devices using LockName."""
-        grouped_events = {}
-        _LOGGER.debug("Starting event log processing. Total logs: %d", len(logs))
+    def _new_log_entries(self, logs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return log entries newer than the high-water mark, oldest first.
+
+        The log is walked from its newest end and the walk stops at the
+        first entry older than the mark, so the cost follows the number of
+        new entries rather than the length of the log.
+        """
+        if not logs:
+            return []
+
+        newest_first = str(logs[0].get("Time", "")) >= str(logs[-1].get("Time", ""))
+        high_water = self._log_high_water
+        new_entries = []
+        for log_entry in logs if newest_first else reversed(logs):
+            timestamp = log_entry.get("Time")
+            if high_water is not None and timestamp is not None:
+                if timestamp < high_water:
+                    break
+                if (
+                    timestamp == high_water
+                    and self._log_key(log_entry) in self._log_keys_at_high_water
+                ):
+                    continue
+            new_entries.append(log_entry)
+        new_entries.reverse()
+
+        for log_entry in new_entries:
+            timestamp = log_entry.get("Time")
+            if timestamp is None:
+                continue
+            if high_water is None or timestamp > high_water:
+                high_water = timestamp
+                self._log_keys_at_high_water = set()
+            if timestamp == high_water:
+                self._log_keys_at_high_water.add(self._log_key(log_entry))
+        self._log_high_water = high_water
+
+        return new_entries
+
+    def _process_event_logs(
+        self, logs, devices: dict[str, Devices], trace: Collection[str] = ()
+    ) -> set[str]:
+        """Process new event logs, associating them with lock devices using LockName.
+
+        Events are appended to a bounded history per lock and event type.
+        Entries of a lock that isn't known yet, for example while Lock Status
+        failed, are held back until it shows up. Returns the serial numbers
+        of the locks that received new events. Entries of locks in ``trace``
+        are logged at debug level.
+        """
+        new_entries = self._new_log_entries(logs)
+        if self._unmatched_log_entries:
+            # Held back entries are older than anything past the mark
+            new_entries[:0] = self._unmatched_log_entries
+            self._unmatched_log_entries.clear()
+        updated: set[str] = set()
+        if not new_entries:
+            return updated
 
         lock_names = {
-            device["name"]: serial_no
+            device.name: serial_no
             for serial_no, device in devices.items()
-            if device.get("model") == "Smart Lock"
+            if isinstance(device, Locks)
         }
+        unknown = 0
 
-        for log_entry in logs:
+        for log_entry in new_entries:
             lock_name = log_entry.get("LockName")
             event_type = log_entry.get("EventType")
             timestamp = log_entry.get("Time")
@@ -254,39 +759,34 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
 
             serial_no = lock_names.get(lock_name)
             if not serial_no:
-                _LOGGER.debug(
-                    "Log entry for unknown lock name '%s', skipping: %s",
-                    lock_name,
-                    log_entry,
-                )
+                self._unmatched_log_entries.append(log_entry)
+                unknown += 1
                 continue
 
-            if serial_no not in grouped_events:
-                grouped_events[serial_no] = {}
-
-            if event_type not in grouped_events[serial_no]:
-                grouped_events[serial_no][event_type] = []
-
-            grouped_events[serial_no][event_type].append(
+            self._event_logs.setdefault(serial_no, {}).setdefault(
+                event_type, deque(maxlen=LOG_HISTORY_SIZE)
+            ).append(
                 {
                     "time": timestamp,
                     "user": user,
                     "channel": channel,
                 }
             )
+            updated.add(serial_no)
 
-            _LOGGER.debug(
-                "Processed log entry for lock '%s' (serial %s) with event type '%s' at %s by %s via %s",
-                lock_name,
-                serial_no,
-                event_type,
-                timestamp,
-                user or "unknown user",
-                channel or "unknown channel",
-            )
+            if serial_no in trace:
+                _LOGGER.debug(
+                    "Processed log entry for lock %s: %s at %s by %s via %s",
+                    serial_no,
+                    event_type,
+                    timestamp,
+                    user or "unknown user",
+                    channel or "unknown channel",
+                )
 
-        _LOGGER.debug("Grouped events by lock: %s", grouped_events)
-        return grouped_events
+        if unknown and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Holding back %d log entries of unknown locks", unknown)
+        return updated
 
     async def process_events(self):
         """Return processed event logs grouped by device."""
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.components.diagnostics.util import async_redact_data
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
-from .coordinator import SectorDataUpdateCoordinator
+from .coordinator import SectorAlarmConfigEntry
 
 TO_REDACT = {
     "AuthorizationToken",
@@ -30,12 +29,42 @@ TO_REDACT = {
     "SerialString",
     "User",
     "UserName",
+    # Keys of the dataclass fields in SectorData
+    "plug_id",
+    "serial_no",
+    "user",
 }
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant, entry: SectorAlarmConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for Sensibo config entry."""
-    coordinator: SectorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    return async_redact_data(coordinator.data, TO_REDACT)
+    coordinator = entry.runtime_data
+    data = asdict(coordinator.data)
+    # The model index only repeats the devices
+    data.pop("by_model")
+    # Devices and logs are keyed by serial number, replace it with a
+    # placeholder that still ties the logs of a lock to its device
+    placeholders: dict[str, str] = {}
+
+    def _placeholder(serial_no: str) -> str:
+        return placeholders.setdefault(serial_no, f"device_{len(placeholders) + 1}")
+
+    data["devices"] = {
+        _placeholder(serial_no): device for serial_no, device in data["devices"].items()
+    }
+    data["logs"] = {
+        _placeholder(serial_no): {
+            event_type: list(logs) for event_type, logs in events.items()
+        }
+        for serial_no, events in data["logs"].items()
+    }
+    data = async_redact_data(data, TO_REDACT)
+    # Keyed by endpoint name, nothing to redact
+    data["endpoint_metrics"] = {
+        endpoint: metrics.as_dict()
+        for endpoint, metrics in coordinator.api.endpoint_metrics.items()
+    }
+    data["requests_saved"] = coordinator.api.requests_saved
+    return data
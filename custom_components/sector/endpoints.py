@@ -3,44 +3,44 @@
 API_URL = "https://mypagesapi.sectoralarm.net"
 
 
-def get_data_endpoints(panel_id):
+def get_data_endpoints(panel_id, api_url: str = API_URL):
     """Return a dictionary of data retrieval endpoints."""
     endpoints = {
         # Housecheck endpoints
-        "Humidity": ("GET", f"{API_URL}/api/housecheck/panels/{panel_id}/humidity"),
-        "Doors and Windows": ("POST", f"{API_URL}/api/v2/housecheck/doorsandwindows"),
-        "Leakage Detectors": ("POST", f"{API_URL}/api/v2/housecheck/leakagedetectors"),
-        "Smoke Detectors": ("POST", f"{API_URL}/api/v2/housecheck/smokedetectors"),
-        "Cameras": ("GET", f"{API_URL}/api/v2/housecheck/cameras/{panel_id}"),
-        "Persons": ("GET", f"{API_URL}/api/persons/panels/{panel_id}"),
-        "Temperatures": ("POST", f"{API_URL}/api/v2/housecheck/temperatures"),
+        "Humidity": ("GET", f"{api_url}/api/housecheck/panels/{panel_id}/humidity"),
+        "Doors and Windows": ("POST", f"{api_url}/api/v2/housecheck/doorsandwindows"),
+        "Leakage Detectors": ("POST", f"{api_url}/api/v2/housecheck/leakagedetectors"),
+        "Smoke Detectors": ("POST", f"{api_url}/api/v2/housecheck/smokedetectors"),
+        "Cameras": ("GET", f"{api_url}/api/v2/housecheck/cameras/{panel_id}"),
+        "Persons": ("GET", f"{api_url}/api/persons/panels/{panel_id}"),
+        "Temperatures": ("POST", f"{api_url}/api/v2/housecheck/temperatures"),
         # Panel endpoints
         "Panel Status": (
             "GET",
-            f"{API_URL}/api/panel/GetPanelStatus?panelId={panel_id}",
+            f"{api_url}/api/panel/GetPanelStatus?panelId={panel_id}",
         ),
         "Smartplug Status": (
             "GET",
-            f"{API_URL}/api/panel/GetSmartplugStatus?panelId={panel_id}",
+            f"{api_url}/api/panel/GetSmartplugStatus?panelId={panel_id}",
         ),
-        "Lock Status": ("GET", f"{API_URL}/api/panel/GetLockStatus?panelId={panel_id}"),
-        "Logs": ("GET", f"{API_URL}/api/panel/GetLogs?panelId={panel_id}"),
+        "Lock Status": ("GET", f"{api_url}/api/panel/GetLockStatus?panelId={panel_id}"),
+        "Logs": ("GET", f"{api_url}/api/panel/GetLogs?panelId={panel_id}"),
     }
     return endpoints
 
 
-def get_action_endpoints():
+def get_action_endpoints(api_url: str = API_URL):
     """Return a dictionary of action endpoints."""
     endpoints = {
         # Lock/Unlock endpoints
-        "Unlock": ("POST", f"{API_URL}/api/Panel/Unlock"),
-        "Lock": ("POST", f"{API_URL}/api/Panel/Lock"),
+        "Unlock": ("POST", f"{api_url}/api/Panel/Unlock"),
+        "Lock": ("POST", f"{api_url}/api/Panel/Lock"),
         # Arm/Disarm endpoints
-        "Arm": ("POST", f"{API_URL}/api/Panel/Arm"),
-        "PartialArm": ("POST", f"{API_URL}/api/Panel/PartialArm"),
-        "Disarm": ("POST", f"{API_URL}/api/Panel/Disarm"),
+        "Arm": ("POST", f"{api_url}/api/Panel/Arm"),
+        "PartialArm": ("POST", f"{api_url}/api/Panel/PartialArm"),
+        "Disarm": ("POST", f"{api_url}/api/Panel/Disarm"),
         # Smartplug endpoints
-        "TurnOnSmartplug": ("POST", f"{API_URL}/api/Panel/TurnOnSmartplug"),
-        "TurnOffSmartplug": ("POST", f"{API_URL}/api/Panel/TurnOffSmartplug"),
+        "TurnOnSmartplug": ("POST", f"{api_url}/api/Panel/TurnOnSmartplug"),
+        "TurnOffSmartplug": ("POST", f"{api_url}/api/Panel/TurnOffSmartplug"),
     }
     return endpoints
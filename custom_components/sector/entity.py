@@ -3,21 +3,56 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import SectorDataUpdateCoordinator
+from .const import DOMAIN, SIGNAL_NEW_DEVICES
+from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
+from .model import Devices
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def async_setup_device_entities(
+    hass: HomeAssistant,
+    entry: SectorAlarmConfigEntry,
+    async_add_devices: Callable[[list[Devices]], None],
+) -> None:
+    """Add entities for the current devices and for devices found later.
+
+    ``async_add_devices`` is called with the current devices, then with the
+    devices found by each refresh that finds new serial numbers.
+    """
+    coordinator = entry.runtime_data
+    async_add_devices(list(coordinator.data.devices.values()))
+
+    @callback
+    def _async_new_devices(serials: set[str]) -> None:
+        devices = coordinator.data.devices
+        async_add_devices(
+            [devices[serial_no] for serial_no in serials if serial_no in devices]
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_DEVICES.format(entry.entry_id), _async_new_devices
+        )
+    )
+
+
 class SectorAlarmBaseEntity(CoordinatorEntity[SectorDataUpdateCoordinator]):
     """Representation of a Sector Alarm base entity."""
 
     _attr_has_entity_name = True
+    # Listener context, the coordinator only updates entities whose context
+    # changed. Defaults to the serial number of the device.
+    _listener_context: str | None = None
 
     def __init__(
         self,
@@ -27,7 +62,7 @@ class SectorAlarmBaseEntity(CoordinatorEntity[SectorDataUpdateCoordinator]):
         device_model: str | None,
     ) -> None:
         """Initialize the base entity with device info."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=self._listener_context or serial_no)
         self._serial_no = serial_no
         self.device_name = device_name
         self.device_model = device_model
@@ -51,6 +86,9 @@ class SectorAlarmBaseEntity(CoordinatorEntity[SectorDataUpdateCoordinator]):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        if self.coordinator.restored:
+            # Data is from the snapshot until the first refresh completes
+            return {"serial_number": self._serial_no, "restored": True}
         return {"serial_number": self._serial_no}
 
     @property
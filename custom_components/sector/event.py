@@ -1,17 +1,24 @@
 """Event platform for Sector Alarm integration."""
 
 import logging
-from datetime import datetime, timezone
+from collections import deque
 
 from homeassistant.components.event import EventEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
-from .entity import SectorAlarmBaseEntity
+from .coordinator import (
+    LOG_HISTORY_SIZE,
+    SectorAlarmConfigEntry,
+    SectorDataUpdateCoordinator,
+)
+from .entity import SectorAlarmBaseEntity, async_setup_device_entities
+from .model import Devices, Locks
 
 _LOGGER = logging.getLogger(__name__)
 
+EVENT_TYPES = ["lock", "unlock", "lock_failed"]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -20,115 +27,121 @@ async def async_setup_entry(
 ) -> None:
     """Set up Sector Alarm event entities."""
     coordinator: SectorDataUpdateCoordinator = entry.runtime_data
-    devices = coordinator.data.get("devices", {})
-    logs = coordinator.data.get("logs", {})
-    entities = []
-
-    # Create event entities for each supported device with event logs
-    for serial_no, device_info in devices.items():
-        if device_info.get("model") == "Smart Lock":  # Filter for Smart Locks
-            # Check if there are logs for this Smart Lock to create event entities
-            if serial_no in logs:
-                entities.append(SectorAlarmEvent(coordinator, serial_no, device_info))
+
+    @callback
+    def _async_add_devices(devices: list[Devices]) -> None:
+        entities = []
+
+        # Create an event entity for each Smart Lock. Logs are not part of
+        # the snapshot, so they may not be known yet.
+        for device_info in devices:
+            if isinstance(device_info, Locks):  # Filter for Smart Locks
+                serial_no = device_info.serial_no
+                entities.append(
+                    SectorAlarmEvent(
+                        coordinator, serial_no, device_info.name, "Smart Lock"
+                    )
+                )
                 _LOGGER.debug(
                     "SECTOR_EVENT: Created event entity for Smart Lock with serial: %s",
                     serial_no,
                 )
 
-    _LOGGER.debug("SECTOR_EVENT: Total event entities added: %d", len(entities))
-    async_add_entities(entities)
+        _LOGGER.debug("SECTOR_EVENT: Total event entities added: %d", len(entities))
+        async_add_entities(entities)
 
+    async_setup_device_entities(hass, entry, _async_add_devices)
 
-class SectorAlarmEvent(SectorAlarmBaseEntity, EventEntity):
-    """Representation of a single event entity for a Sector Alarm device."""
 
-    def __init__(self, coordinator, serial_no, device_info):
+class SectorAlarmEvent(SectorAlarmBaseEntity, EventEntity):
+    """Representation of a single event entity for a Sector Alarm device.
+
+    Each log entry is fired once, identified by its event type, time, user
+    and channel. Only a bounded window of recent keys is remembered, which
+    grows to cover the history the coordinator keeps per lock, for every
+    event type the API sends.
+    """
+
+    _attr_event_types = EVENT_TYPES
+    _attr_name = "Event log"
+
+    def __init__(
+        self,
+        coordinator: SectorDataUpdateCoordinator,
+        serial_no: str,
+        device_name: str,
+        device_model: str | None,
+    ) -> None:
         """Initialize the single event entity for the device."""
-        super().__init__(coordinator, serial_no, device_info)
-        self._events = []
-        self._last_event_type = None
-        self._attr_name = f"{device_info['name']} Event Log"
+        super().__init__(coordinator, serial_no, device_name, device_model)
         self._attr_unique_id = f"{serial_no}_event"
-        self._attr_device_class = "timestamp"
+        window = LOG_HISTORY_SIZE * len(EVENT_TYPES)
+        self._recent_keys: deque[tuple[str, str, str, str]] = deque(maxlen=window)
+        self._seen_keys: set[tuple[str, str, str, str]] = set()
+        # Whether the last written state carries the restored attribute
+        self._shows_restored = coordinator.restored
         _LOGGER.debug(
             "SECTOR_EVENT: Initialized SectorAlarmEvent for device: %s (%s)",
-            device_info["name"],
+            device_name,
             serial_no,
         )
 
-    @property
-    def event_types(self):
-        """Return the list of event types this entity can handle."""
-        return ["lock", "unlock", "lock_failed"]
+    async def async_added_to_hass(self) -> None:
+        """Mark the existing history as seen so it is not replayed."""
+        await super().async_added_to_hass()
+        self._collect_new_events()
 
-    async def async_update(self):
-        """Update entity based on the most recent event."""
-        grouped_events = await self.coordinator.process_events()
-        events_for_device = grouped_events.get(self._serial_no)
+    def _collect_new_events(self) -> list[tuple[str, dict[str, str]]]:
+        """Return unseen events for the device, oldest first, and mark them seen."""
+        events_for_device = self.coordinator.data.logs.get(self._serial_no, {})
+        history = sum(len(logs) for logs in events_for_device.values())
+        if history > self._recent_keys.maxlen:
+            self._recent_keys = deque(self._recent_keys, maxlen=history)
 
-        if not events_for_device:
-            _LOGGER.debug(
-                "SECTOR_EVENT: No events found for device %s", self._serial_no
-            )
+        new_events = []
+        for event_type, logs in events_for_device.items():
+            for log in logs:
+                key = (event_type, log["time"], log["user"], log["channel"])
+                if key in self._seen_keys:
+                    continue
+                if len(self._recent_keys) == self._recent_keys.maxlen:
+                    self._seen_keys.discard(self._recent_keys[0])
+                self._recent_keys.append(key)
+                self._seen_keys.add(key)
+                new_events.append((event_type, log))
+
+        new_events.sort(key=lambda event: event[1]["time"])
+        return new_events
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Fire new events, writing state after each of them."""
+        new_events = self._collect_new_events()
+        restored_cleared = self._shows_restored and not self.coordinator.restored
+        self._shows_restored = self.coordinator.restored
+        if not new_events or self.coordinator.log_history_update:
+            # The first log after a restore is only marked seen
+            if restored_cleared:
+                self.async_write_ha_state()
             return
 
-        for event_type, logs in events_for_device.items():
-            latest_log = logs[-1]
-            self._last_event_type = event_type
-            self._events.append(latest_log)
-            self._trigger_event(self._last_event_type, latest_log)
+        trace = self._serial_no in self.coordinator.trace_serials
+        for event_type, log in new_events:
+            if event_type not in EVENT_TYPES:
+                if trace:
+                    _LOGGER.debug(
+                        "SECTOR_EVENT: Ignoring unsupported event type %s for %s",
+                        event_type,
+                        self._serial_no,
+                    )
+                continue
+            if trace:
+                _LOGGER.debug(
+                    "SECTOR_EVENT: Triggering event for device %s with event type %s and timestamp %s",
+                    self._serial_no,
+                    event_type,
+                    log["time"],
+                )
+            # An event entity only holds the last event, write each one
+            self._trigger_event(event_type, dict(log))
             self.async_write_ha_state()
-
-    def _trigger_event(self, event_type, event_attributes):
-        """Trigger an event with timestamp and details."""
-        event_timestamp = event_attributes.get(
-            "Time", datetime.now(timezone.utc).isoformat()
-        )
-        event_attributes["timestamp"] = event_timestamp
-        _LOGGER.debug(
-            "SECTOR_EVENT: Triggering event for device %s with event type %s and timestamp %s",
-            self._serial_no,
-            event_type,
-            event_timestamp,
-        )
-        super()._trigger_event(event_type, event_attributes)
-
-    @property
-    def state(self) -> str:
-        """Return the latest event type for the device."""
-        return self._last_event_type or "No events"
-
-    @property
-    def extra_state_attributes(self):
-        """Return additional attributes for the most recent event."""
-        if not self._events:
-            return {}
-
-        recent_event = self._events[-1]
-        return {
-            "time": recent_event.get("Time"),
-            "user": recent_event.get("User", "unknown"),
-            "channel": recent_event.get("Channel", "unknown"),
-        }
-
-    @property
-    def device_info(self):
-        """Return device information to associate this entity with a Smart Lock."""
-        return {
-            "identifiers": {("sector", self._serial_no)},
-            "name": self._device_info["name"],
-            "manufacturer": "Sector Alarm",
-            "model": self._device_info["model"],
-        }
-
-    async def async_added_to_hass(self):
-        """Set up continuous event processing once added to Home Assistant."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(
-                lambda: self.hass.async_create_task(self.async_update())
-            )
-        )
-        _LOGGER.debug(
-            "SECTOR_EVENT: Continuous event processing set up for %s", self._attr_name
-        )
@@ -0,0 +1,113 @@
+"""Account hub shared by the Sector Alarm config entries of one account."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant, callback
+
+from .client import AuthenticationError, SectorAlarmAPI
+from .const import CONF_DEDICATED_SESSION, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SectorAccountHub:
+    """A Sector Alarm account and the config entries using it.
+
+    Every panel of the account shares one session, access token and rate
+    limiter. Account level calls such as the panel list are made once and
+    shared by all panels. The session type is taken from the first entry
+    set up for the account.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        email: str,
+        password: str,
+        dedicated_session: bool,
+        api_url: str | None = None,
+    ) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.dedicated_session = dedicated_session
+        self.api = SectorAlarmAPI(
+            hass,
+            email,
+            password,
+            None,
+            refresh_token_ahead=True,
+            dedicated_session=dedicated_session,
+            api_url=api_url,
+        )
+        self.entry_ids: set[str] = set()
+        self._panel_list: asyncio.Task[dict[str, str]] | None = None
+
+    def panel_api(self, panel_id: str, **kwargs: Any) -> SectorAlarmAPI:
+        """Return a client for a panel sharing the account connection."""
+        return SectorAlarmAPI(
+            self.hass,
+            self.api.email,
+            self.api.password,
+            panel_id,
+            account=self.api,
+            **kwargs,
+        )
+
+    async def async_get_panel_list(self) -> dict[str, str]:
+        """Return the panel names by panel id, fetched once for all panels."""
+        if self._panel_list is None:
+            self._panel_list = asyncio.ensure_future(self.api.get_panel_list())
+        try:
+            panels = await asyncio.shield(self._panel_list)
+        except AuthenticationError:
+            self._panel_list = None
+            raise
+        if not panels:
+            # Try again next time rather than caching a failure
+            self._panel_list = None
+        return panels
+
+    async def async_close(self) -> None:
+        """Close the account connection."""
+        if self._panel_list is not None and not self._panel_list.done():
+            self._panel_list.cancel()
+        await self.api.async_close()
+
+
+@callback
+def async_get_hub(hass: HomeAssistant, entry: ConfigEntry) -> SectorAccountHub:
+    """Return the hub for the account of an entry, creating it if needed."""
+    hubs: dict[str, SectorAccountHub] = hass.data.setdefault(DOMAIN, {})
+    key = entry.data[CONF_EMAIL].lower()
+    if (hub := hubs.get(key)) is None:
+        hub = hubs[key] = SectorAccountHub(
+            hass,
+            entry.data[CONF_EMAIL],
+            entry.data[CONF_PASSWORD],
+            entry.options.get(CONF_DEDICATED_SESSION, False),
+        )
+    elif hub.api.password != entry.data[CONF_PASSWORD]:
+        # The entry was reauthenticated, log in with the new password
+        hub.api.password = entry.data[CONF_PASSWORD]
+        hub.api.token_manager.token = None
+    hub.entry_ids.add(entry.entry_id)
+    _LOGGER.debug("Account hub used by %d entries", len(hub.entry_ids))
+    return hub
+
+
+async def async_release_hub(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Release the hub of an entry, closing it when no entry uses it."""
+    hubs: dict[str, SectorAccountHub] = hass.data.get(DOMAIN, {})
+    key = entry.data[CONF_EMAIL].lower()
+    if (hub := hubs.get(key)) is None:
+        return
+    hub.entry_ids.discard(entry.entry_id)
+    if not hub.entry_ids:
+        del hubs[key]
+        await hub.async_close()
@@ -2,49 +2,142 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SectorData:
     """Dataclass for all data."""
 
-    alarm: PanelStatus
-    devices: Devices
-    locks: Locks
+    panel_status: PanelStatus
+    devices: dict[str, Devices] = field(default_factory=dict)
+    logs: dict[str, dict[str, deque[dict[str, str]]]] = field(default_factory=dict)
+    # Devices by model, then serial number
+    by_model: dict[str, dict[str, Devices]] = field(default_factory=dict)
 
+    def update_index(self, serials: Iterable[str]) -> None:
+        """Re-index the given serial numbers after they were added, changed or removed."""
+        for serial_no in serials:
+            for model_devices in self.by_model.values():
+                model_devices.pop(serial_no, None)
+            if (device := self.devices.get(serial_no)) is not None:
+                self.by_model.setdefault(device.model, {})[serial_no] = device
 
-@dataclass
-class Locks:
-    """Dataclass Locks."""
+    def of_model(self, model: str) -> dict[str, Devices]:
+        """Return the devices of a model keyed by serial number."""
+        return self.by_model.get(model, {})
 
-    name: str
-    serial_no: str
-    lock_status: str  # Which are valid?
-    low_battery: bool
-    sound_level: int
-    autolock: bool
-    model: str = "Smart Lock"
+    def as_snapshot(self) -> dict[str, Any]:
+        """Return panel status and devices as JSON serializable data.
+
+        Logs are left out, they are only useful when fresh.
+        """
+        return {
+            "panel_status": asdict(self.panel_status),
+            "devices": [
+                {"kind": type(device).__name__, **asdict(device)}
+                for device in self.devices.values()
+            ],
+        }
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: dict[str, Any], logs: dict[str, Any] | None = None
+    ) -> SectorData:
+        """Create data from as_snapshot output, skipping unknown fields."""
+        data = cls(
+            panel_status=_from_dict(PanelStatus, snapshot.get("panel_status", {})),
+            logs=logs if logs is not None else {},
+        )
+        for values in snapshot.get("devices", []):
+            if (device_class := DEVICE_CLASSES.get(values.get("kind"))) is None:
+                continue
+            device = _from_dict(device_class, values)
+            data.devices[device.serial_no] = device
+        data.update_index(data.devices)
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Devices:
-    """Dataclass for devices."""
+    """Dataclass for devices.
+
+    Sensor fields are None when the device does not report them.
+    """
 
     name: str
     serial_no: str
-    device_status: int | bool  # Needs to be checked
     model: str
-    type: str
-    low_battery: bool
-    closed: bool  # Only valid doors/windows
-    alarm: bool  # Only valid doors/windows+smoke detectors+leakage detectors likely
+    type: str = ""
+    closed: bool | None = None  # Only valid doors/windows
+    low_battery: bool | None = None
+    alarm: bool | None = (
+        None  # Only valid doors/windows+smoke detectors+leakage detectors likely
+    )
+    temperature: float | None = None
+    humidity: float | None = None
+
+    def update(self, **values: Any) -> bool:
+        """Update fields in place, return True if any value changed."""
+        return _update_fields(self, values)
+
 
+@dataclass(slots=True)
+class Locks(Devices):
+    """Dataclass Locks."""
+
+    model: str = "Smart Lock"
+    lock_status: str | None = None  # "lock" or "unlock"
 
-@dataclass
+
+@dataclass(slots=True)
+class SmartPlugs(Devices):
+    """Dataclass for smart plugs."""
+
+    model: str = "Smart Plug"
+    plug_id: str | None = None  # Id used by the TurnOn/TurnOff endpoints
+    is_on: bool | None = None
+
+
+@dataclass(slots=True)
 class PanelStatus:
     """Dataclass for Alarm Panel."""
 
-    alarm_state: int
-    is_online: bool
-    ready_to_arm: bool
+    alarm_state: int = 0
+    is_online: bool | None = None
+    ready_to_arm: bool | None = None
+    serial_no: str | None = None
+
+    def update_from_api(self, data: dict[str, Any]) -> bool:
+        """Update from a GetPanelStatus response, return True if changed."""
+        values = {
+            "alarm_state": data.get("Status", 0),
+            "is_online": data.get("IsOnline"),
+            "ready_to_arm": data.get("ReadyToArm"),
+            "serial_no": data.get("SerialNo"),
+        }
+        return _update_fields(self, values)
+
+
+DEVICE_CLASSES: dict[str, type[Devices]] = {
+    device_class.__name__: device_class for device_class in (Devices, Locks, SmartPlugs)
+}
+
+
+def _from_dict(data_class: type, values: dict[str, Any]) -> Any:
+    """Create a dataclass instance from the known fields in values."""
+    names = {data_field.name for data_field in fields(data_class)}
+    return data_class(**{key: value for key, value in values.items() if key in names})
+
+
+def _update_fields(obj: Any, values: dict[str, Any]) -> bool:
+    """Set attributes on obj in place, return True if any value changed."""
+    changed = False
+    for key, value in values.items():
+        if getattr(obj, key) != value:
+            setattr(obj, key, value)
+            changed = True
+    return changed
@@ -0,0 +1,154 @@
+"""Refresh cycle profiling for Sector Alarm."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RefreshProfiler:
+    """Time the phases of a number of coordinator refresh cycles.
+
+    Phases are auth, fetch (all due endpoints), fetch and decode per
+    endpoint, devices, logs and listeners. The coordinator opens a cycle
+    when a refresh starts and closes it once listeners are updated, or when
+    the refresh fails. With ``cprofile`` a cProfile profiler runs during
+    each cycle. It sees everything the event loop runs meanwhile, not only
+    the refresh.
+    """
+
+    def __init__(self, hass: HomeAssistant, cycles: int, cprofile: bool) -> None:
+        """Initialize the profiler for ``cycles`` refreshes."""
+        self.cycles = cycles
+        self.started = dt_util.utcnow()
+        self.results: list[dict[str, Any]] = []
+        self.done: asyncio.Future[None] = hass.loop.create_future()
+        self.profile = cProfile.Profile() if cprofile else None
+        self._phases: defaultdict[str, float] | None = None
+        self._cycle_start = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Return True while a cycle is open."""
+        return self._phases is not None
+
+    def start_cycle(self) -> None:
+        """Open a cycle, dropping one left open by a cancelled refresh."""
+        if self.running:
+            self._disable_profile()
+        self._phases = defaultdict(float)
+        self._cycle_start = time.perf_counter()
+        if self.profile is not None:
+            try:
+                self.profile.enable()
+            except ValueError as err:
+                # Another profiler is already running in this thread
+                _LOGGER.warning("Refresh profiling continues without cProfile: %s", err)
+                self.profile = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the open cycle."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float | None) -> None:
+        """Add time measured elsewhere to a phase of the open cycle."""
+        if self._phases is not None and seconds is not None:
+            self._phases[name] += seconds
+
+    def end_cycle(self, error: Exception | None = None) -> bool:
+        """Close the open cycle, return True once every cycle is done."""
+        if self._phases is None:
+            return False
+        self._disable_profile()
+        self.results.append(
+            {
+                "total": time.perf_counter() - self._cycle_start,
+                "error": type(error).__name__ if error is not None else None,
+                "phases": dict(self._phases),
+            }
+        )
+        self._phases = None
+        if len(self.results) < self.cycles:
+            return False
+        if not self.done.done():
+            self.done.set_result(None)
+        return True
+
+    def stop(self) -> None:
+        """Stop profiling before every cycle is done."""
+        self._disable_profile()
+        self._phases = None
+
+    def _disable_profile(self) -> None:
+        """Stop cProfile until the next cycle."""
+        if self.profile is not None:
+            self.profile.disable()
+
+    def report(self) -> dict[str, Any]:
+        """Return the timings per phase over all cycles, in milliseconds."""
+        samples: defaultdict[str, list[float]] = defaultdict(list)
+        for result in self.results:
+            samples["total"].append(result["total"])
+            for name, seconds in result["phases"].items():
+                samples[name].append(seconds)
+        return {
+            "started": self.started.isoformat(),
+            "finished": dt_util.utcnow().isoformat(),
+            "cycles": len(self.results),
+            "failed_cycles": sum(1 for result in self.results if result["error"]),
+            "phases": {
+                name: {
+                    "cycles": len(values),
+                    "mean_ms": round(sum(values) / len(values) * 1000, 3),
+                    "min_ms": round(min(values) * 1000, 3),
+                    "max_ms": round(max(values) * 1000, 3),
+                }
+                for name, values in samples.items()
+            },
+            "cycle_details": [
+                {
+                    "total_ms": round(result["total"] * 1000, 3),
+                    "error": result["error"],
+                    "phases_ms": {
+                        name: round(seconds * 1000, 3)
+                        for name, seconds in result["phases"].items()
+                    },
+                }
+                for result in self.results
+            ],
+        }
+
+
+def write_report(
+    directory: Path, name: str, report: dict[str, Any], profile: cProfile.Profile | None
+) -> list[Path]:
+    """Write the report, and the cProfile stats if any, return the paths.
+
+    Runs in the executor.
+    """
+    report_path = directory / f"{name}.json"
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    paths = [report_path]
+    if profile is not None:
+        profile_path = directory / f"{name}.prof"
+        profile.dump_stats(profile_path)
+        paths.append(profile_path)
+    return paths
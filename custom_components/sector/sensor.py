@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-
-from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
-from .entity import SectorAlarmBaseEntity
+from homeassistant.util import dt as dt_util
+
+from .client import EndpointMetrics
+from .const import CONF_PANEL_ID
+from .coordinator import (
+    DIAGNOSTIC_CONTEXT,
+    SectorAlarmConfigEntry,
+    SectorDataUpdateCoordinator,
+)
+from .entity import SectorAlarmBaseEntity, async_setup_device_entities
+from .model import Devices
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +51,51 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class SectorEndpointMetricDescription(SensorEntityDescription):
+    """Describes a request metric of a data endpoint."""
+
+    value_fn: Callable[[EndpointMetrics], Any]
+
+
+ENDPOINT_METRIC_TYPES: tuple[SectorEndpointMetricDescription, ...] = (
+    SectorEndpointMetricDescription(
+        key="latency",
+        name="latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: (
+            round(metrics.latency * 1000) if metrics.latency is not None else None
+        ),
+    ),
+    SectorEndpointMetricDescription(
+        key="errors",
+        name="errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.errors,
+    ),
+    SectorEndpointMetricDescription(
+        key="payload_size",
+        name="response size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.payload_bytes,
+    ),
+    SectorEndpointMetricDescription(
+        key="last_success",
+        name="last success",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda metrics: (
+            dt_util.utc_from_timestamp(metrics.last_success)
+            if metrics.last_success is not None
+            else None
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: SectorAlarmConfigEntry,
@@ -40,28 +103,46 @@ async def async_setup_entry(
 ) -> None:
     """Set up Sector Alarm sensors."""
     coordinator = entry.runtime_data
-    devices: dict[str, dict[str, Any]] = coordinator.data.get("devices", {})
-    entities: list[SectorAlarmSensor] = []
-
-    for device in devices.values():
-        serial_no = device["serial_no"]
-        sensors = device.get("sensors", {})
-        device_name = device.get("name", "Unknown Device")
-        device_model = device.get("model", "")
-
-        for description in SENSOR_TYPES:
-            if description.key in sensors:
-                entities.append(
-                    SectorAlarmSensor(
-                        coordinator, serial_no, description, device_name, device_model
+    async_add_entities(
+        [
+            SectorAlarmRequestBudgetSensor(coordinator),
+            *(
+                SectorAlarmEndpointMetricSensor(coordinator, endpoint, description)
+                for endpoint in coordinator.api.data_endpoints
+                for description in ENDPOINT_METRIC_TYPES
+            ),
+        ]
+    )
+
+    @callback
+    def _async_add_devices(devices: list[Devices]) -> None:
+        entities: list[SectorAlarmSensor] = []
+        for device in devices:
+            serial_no = device.serial_no
+            device_name = device.name or "Unknown Device"
+            device_model = device.model
+
+            for description in SENSOR_TYPES:
+                if getattr(device, description.key) is not None:
+                    entities.append(
+                        SectorAlarmSensor(
+                            coordinator,
+                            serial_no,
+                            description,
+                            device_name,
+                            device_model,
+                        )
                     )
-                )
-                _LOGGER.debug("Added temperature sensor for device %s", serial_no)
+                    _LOGGER.debug(
+                        "Added %s sensor for device %s", description.key, serial_no
+                    )
+
+        if entities:
+            async_add_entities(entities)
+        else:
+            _LOGGER.debug("No sensor entities to add.")
 
-    if entities:
-        async_add_entities(entities)
-    else:
-        _LOGGER.debug("No sensor entities to add.")
+    async_setup_device_entities(hass, entry, _async_add_devices)
 
 
 class SectorAlarmSensor(SectorAlarmBaseEntity, SensorEntity):
@@ -85,5 +166,89 @@ class SectorAlarmSensor(SectorAlarmBaseEntity, SensorEntity):
     @property
     def native_value(self) -> float | None:
         """Return the sensor value."""
-        device = self.coordinator.data["devices"].get(self._serial_no)
-        return device["sensors"].get(self.entity_description.key) if device else None
+        device = self.coordinator.data.devices.get(self._serial_no)
+        return getattr(device, self.entity_description.key) if device else None
+
+
+class SectorAlarmRequestBudgetSensor(SectorAlarmBaseEntity, SensorEntity):
+    """Share of the account request budget in use."""
+
+    _attr_name = "Request budget used"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _listener_context = DIAGNOSTIC_CONTEXT
+
+    def __init__(self, coordinator: SectorDataUpdateCoordinator) -> None:
+        """Initialize the sensor on the panel device."""
+        super().__init__(
+            coordinator,
+            coordinator.config_entry.data[CONF_PANEL_ID],
+            coordinator.panel_name,
+            "Alarm panel",
+        )
+        self._attr_unique_id = f"{self._serial_no}_request_budget"
+
+    @property
+    def native_value(self) -> float:
+        """Return the budget in use, in percent."""
+        return self.coordinator.api.rate_limiter.usage
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the limiter settings and throttling state."""
+        limiter = self.coordinator.api.rate_limiter
+        return {
+            **super().extra_state_attributes,
+            "capacity": limiter.capacity,
+            "refill_per_second": limiter.refill,
+            "rate_limited_responses": limiter.rate_limited,
+            "paused_for": round(limiter.paused_for),
+        }
+
+
+class SectorAlarmEndpointMetricSensor(SectorAlarmBaseEntity, SensorEntity):
+    """Request metric of one data endpoint, for tuning polling intervals."""
+
+    entity_description: SectorEndpointMetricDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _listener_context = DIAGNOSTIC_CONTEXT
+
+    def __init__(
+        self,
+        coordinator: SectorDataUpdateCoordinator,
+        endpoint: str,
+        entity_description: SectorEndpointMetricDescription,
+    ) -> None:
+        """Initialize the sensor on the panel device."""
+        super().__init__(
+            coordinator,
+            coordinator.config_entry.data[CONF_PANEL_ID],
+            coordinator.panel_name,
+            "Alarm panel",
+        )
+        self.entity_description = entity_description
+        self._endpoint = endpoint
+        self._attr_name = f"{endpoint} {entity_description.name}"
+        slug = endpoint.lower().replace(" ", "_")
+        self._attr_unique_id = f"{self._serial_no}_{slug}_{entity_description.key}"
+
+    @property
+    def native_value(self) -> float | int | datetime | None:
+        """Return the metric, None before the first request."""
+        if (
+            metrics := self.coordinator.api.endpoint_metrics.get(self._endpoint)
+        ) is None:
+            return None
+        return self.entity_description.value_fn(metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the full statistics on the latency sensor."""
+        attributes = super().extra_state_attributes
+        if self.entity_description.key == "latency" and (
+            metrics := self.coordinator.api.endpoint_metrics.get(self._endpoint)
+        ):
+            attributes = {**attributes, **metrics.as_dict()}
+        return attributes
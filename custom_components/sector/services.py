@@ -0,0 +1,119 @@
+"""Services for Sector Alarm integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+
+import voluptuous as vol
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
+from .profiler import RefreshProfiler, write_report
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_CPROFILE = "cprofile"
+
+DEFAULT_PROFILE_CYCLES = 5
+MAX_PROFILE_CYCLES = 100
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)
+        ),
+        vol.Optional(ATTR_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Sector Alarm services."""
+
+    async def async_profile_refresh(call: ServiceCall) -> None:
+        """Profile the next refresh cycles of a panel.
+
+        Returns once profiling has started. The report is written to the
+        config directory after the last cycle.
+        """
+        entry: SectorAlarmConfigEntry | None = hass.config_entries.async_get_entry(
+            call.data[ATTR_CONFIG_ENTRY_ID]
+        )
+        if entry is None or entry.domain != DOMAIN:
+            raise ServiceValidationError("Unknown Sector Alarm config entry")
+        if entry.state is not ConfigEntryState.LOADED:
+            raise ServiceValidationError(f"{entry.title} is not loaded")
+        coordinator = entry.runtime_data
+        if coordinator.profiler is not None:
+            raise ServiceValidationError(f"{entry.title} is already being profiled")
+
+        profiler = coordinator.async_start_profiling(
+            call.data[ATTR_CYCLES], call.data[ATTR_CPROFILE]
+        )
+        _LOGGER.info(
+            "Profiling the next %d refreshes of %s", profiler.cycles, entry.title
+        )
+        entry.async_create_background_task(
+            hass,
+            _async_finish_profile(hass, entry, coordinator, profiler),
+            "sector_profile_refresh",
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+    )
+
+
+async def _async_finish_profile(
+    hass: HomeAssistant,
+    entry: SectorAlarmConfigEntry,
+    coordinator: SectorDataUpdateCoordinator,
+    profiler: RefreshProfiler,
+) -> None:
+    """Write the report once the profiled cycles are done."""
+    try:
+        await profiler.done
+    except asyncio.CancelledError:
+        # The entry was unloaded, don't leave cProfile running
+        profiler.stop()
+        if coordinator.profiler is profiler:
+            coordinator.profiler = None
+        raise
+    report = {
+        "entry_id": entry.entry_id,
+        "title": entry.title,
+        **profiler.report(),
+        "endpoint_metrics": {
+            endpoint: metrics.as_dict()
+            for endpoint, metrics in coordinator.api.endpoint_metrics.items()
+        },
+    }
+    name = f"{DOMAIN}_profile_{dt_util.now().strftime('%Y%m%d_%H%M%S')}"
+    paths = await hass.async_add_executor_job(
+        write_report, Path(hass.config.path()), name, report, profiler.profile
+    )
+    _LOGGER.info("Refresh profile of %s written to %s", entry.title, paths)
+    persistent_notification.async_create(
+        hass,
+        f"Profiled {report['cycles']} refreshes, "
+        f"mean {report['phases']['total']['mean_ms']:.0f} ms. Report written to "
+        + ", ".join(f"`{path.name}`" for path in paths),
+        title=f"Sector Alarm profile of {entry.title}",
+        notification_id=f"{DOMAIN}_profile_{entry.entry_id}",
+    )
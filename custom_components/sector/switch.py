@@ -3,17 +3,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.switch import (
     SwitchDeviceClass,
     SwitchEntity,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import SectorAlarmConfigEntry, SectorDataUpdateCoordinator
-from .entity import SectorAlarmBaseEntity
+from .entity import SectorAlarmBaseEntity, async_setup_device_entities
+from .model import Devices, SmartPlugs
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,13 +25,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up Sector Alarm switches."""
     coordinator = entry.runtime_data
-    devices = coordinator.data.get("devices", {})
-    smartplugs = devices.get("smartplugs", [])
 
-    if smartplugs:
-        async_add_entities(SectorAlarmSwitch(coordinator, plug) for plug in smartplugs)
-    else:
-        _LOGGER.debug("No switch entities to add.")
+    @callback
+    def _async_add_devices(devices: list[Devices]) -> None:
+        if smartplugs := [plug for plug in devices if isinstance(plug, SmartPlugs)]:
+            async_add_entities(
+                SectorAlarmSwitch(coordinator, plug) for plug in smartplugs
+            )
+        else:
+            _LOGGER.debug("No switch entities to add.")
+
+    async_setup_device_entities(hass, entry, _async_add_devices)
 
 
 class SectorAlarmSwitch(SectorAlarmBaseEntity, SwitchEntity):
@@ -41,37 +45,28 @@ class SectorAlarmSwitch(SectorAlarmBaseEntity, SwitchEntity):
     _attr_name = None
 
     def __init__(
-        self, coordinator: SectorDataUpdateCoordinator, plug_data: dict[str, Any]
+        self, coordinator: SectorDataUpdateCoordinator, plug: SmartPlugs
     ) -> None:
         """Initialize the switch."""
-        self._id = plug_data.get("Id")
-        serial_no = str(plug_data.get("SerialNo") or plug_data.get("Serial"))
-        super().__init__(
-            coordinator,
-            serial_no,
-            plug_data.get("Label", "Sector Smart Plug"),
-            "Smart Plug",
-        )
+        self._id = plug.plug_id
+        super().__init__(coordinator, plug.serial_no, plug.name, plug.model)
 
         self._attr_unique_id = f"{self._serial_no}_switch"
 
     @property
     def is_on(self):
         """Return true if the switch is on."""
-        smartplugs = self.coordinator.data["devices"].get("smartplugs", [])
-        for plug in smartplugs:
-            if plug.get("Id") == self._id:
-                return plug.get("State") == "On"
-        return False
+        plug = self.coordinator.data.devices.get(self._serial_no)
+        return bool(plug.is_on) if isinstance(plug, SmartPlugs) else False
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
         success = await self.coordinator.api.turn_on_smartplug(self._id)
         if success:
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_fast_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the switch off."""
         success = await self.coordinator.api.turn_off_smartplug(self._id)
         if success:
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_fast_refresh()
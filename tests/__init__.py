@@ -0,0 +1 @@
+"""Tests for the Sector Alarm integration."""
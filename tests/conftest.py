@@ -0,0 +1,122 @@
+"""Fixtures for Sector Alarm tests."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.sector.client import (
+    RateLimiter,
+    SectorAlarmAPI,
+    TokenManager,
+)
+from custom_components.sector.const import CONF_PANEL_ID, DOMAIN
+from custom_components.sector.coordinator import SectorDataUpdateCoordinator
+from custom_components.sector.hub import SectorAccountHub
+
+PANEL_ID = "1234"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable the integration in every test."""
+
+
+class FakeResponse:
+    """The parts of aiohttp.ClientResponse the client reads."""
+
+    def __init__(self, status: int, body: Any = None) -> None:
+        """Initialize with a status and a JSON serializable body."""
+        self.status = status
+        self.headers = {"Content-Type": "application/json; charset=utf-8"}
+        self._body = b"" if body is None else json.dumps(body).encode()
+        self.content_length = len(self._body)
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def __aenter__(self) -> FakeResponse:
+        """Enter the request context."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Leave the request context."""
+
+
+class FakeSession:
+    """Session answering requests with scripted responses in order.
+
+    An exception in the script is raised instead of answering.
+    """
+
+    def __init__(self, *responses: FakeResponse | Exception) -> None:
+        """Initialize with the responses to give."""
+        self.responses = list(responses)
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+
+    def request(
+        self, method: str, url: str, *, headers: dict[str, str], **kwargs: Any
+    ) -> FakeResponse:
+        """Return the next response."""
+        self.requests.append((method, url, headers))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class FakeAccount:
+    """Account whose session, tokens and rate limiter a panel client shares."""
+
+    API_URL = "https://sector.invalid"
+
+    def __init__(self, hass: HomeAssistant, session: FakeSession) -> None:
+        """Initialize with a session and a login counting its tokens."""
+        self.session = session
+        self.logins = 0
+        self.token_manager = TokenManager(hass, self._login)
+        self.rate_limiter = RateLimiter()
+
+    async def _login(self) -> str:
+        self.logins += 1
+        return f"token-{self.logins}"
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    """Return a session without responses, tests add them."""
+    return FakeSession()
+
+
+@pytest.fixture
+def account(hass: HomeAssistant, session: FakeSession) -> FakeAccount:
+    """Return an account using the fake session."""
+    return FakeAccount(hass, session)
+
+
+@pytest.fixture
+def api(hass: HomeAssistant, account: FakeAccount) -> SectorAlarmAPI:
+    """Return a panel client sharing the fake account."""
+    return SectorAlarmAPI(hass, "", "", PANEL_ID, account=account)
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant) -> SectorDataUpdateCoordinator:
+    """Return a coordinator that is never refreshed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_EMAIL: "user@example.com",
+            CONF_PASSWORD: "",
+            CONF_PANEL_ID: PANEL_ID,
+        },
+    )
+    entry.add_to_hass(hass)
+    hub = SectorAccountHub(hass, "user@example.com", "", False)
+    return SectorDataUpdateCoordinator(hass, entry, hub)
@@ -0,0 +1,221 @@
+"""Tests for the Sector Alarm API client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.sector import client
+from custom_components.sector.client import (
+    CircuitBreaker,
+    EndpointMetrics,
+    PermanentAPIError,
+    RateLimitedError,
+    RateLimiter,
+    SectorAlarmAPI,
+    TransientAPIError,
+)
+
+from .conftest import FakeAccount, FakeResponse, FakeSession
+
+URL = "https://sector.invalid/api/v2/housecheck/temperatures"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry without sleeping."""
+    monkeypatch.setattr(client, "RETRY_BACKOFF", 0)
+
+
+async def test_execute_retries_transient_errors(
+    api: SectorAlarmAPI, session: FakeSession
+) -> None:
+    """A GET is retried after server errors and timeouts."""
+    session.responses = [
+        FakeResponse(503),
+        asyncio.TimeoutError(),
+        FakeResponse(200, {"Sections": []}),
+    ]
+
+    assert await api._execute("GET", URL) == {"Sections": []}
+    assert len(session.requests) == 3
+
+
+async def test_execute_gives_up_after_retry_attempts(
+    api: SectorAlarmAPI, session: FakeSession
+) -> None:
+    """The last transient error is raised once every attempt failed."""
+    session.responses = [FakeResponse(500)] * client.RETRY_ATTEMPTS
+
+    with pytest.raises(TransientAPIError):
+        await api._execute("GET", URL)
+    assert len(session.requests) == client.RETRY_ATTEMPTS
+
+
+@pytest.mark.parametrize(
+    ("method", "response"),
+    [("POST", FakeResponse(500)), ("GET", FakeResponse(404))],
+)
+async def test_execute_does_not_retry(
+    api: SectorAlarmAPI, session: FakeSession, method: str, response: FakeResponse
+) -> None:
+    """Commands and permanent errors are sent only once."""
+    session.responses = [response, FakeResponse(200, {})]
+
+    with pytest.raises((TransientAPIError, PermanentAPIError)):
+        await api._execute(method, URL, {"PanelId": "1234"})
+    assert len(session.requests) == 1
+
+
+async def test_execute_deadline_covers_retries(
+    api: SectorAlarmAPI, session: FakeSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """No retry is made when its backoff would outlast the timeout."""
+    monkeypatch.setattr(client, "RETRY_BACKOFF", 10)
+    session.responses = [FakeResponse(500), FakeResponse(200, {})]
+
+    start = time.monotonic()
+    with pytest.raises(TransientAPIError):
+        await api._execute("GET", URL, timeout=1)
+    assert time.monotonic() - start < 1
+    assert len(session.requests) == 1
+
+
+async def test_execute_times_out_slow_attempt(
+    api: SectorAlarmAPI, session: FakeSession
+) -> None:
+    """An attempt is cut off at the deadline."""
+
+    class SlowResponse(FakeResponse):
+        async def __aenter__(self) -> FakeResponse:
+            await asyncio.sleep(10)
+            return self
+
+    session.responses = [SlowResponse(200, {})]
+
+    start = time.monotonic()
+    with pytest.raises(TransientAPIError, match="Timeout"):
+        await api._execute("GET", URL, timeout=0.1)
+    assert time.monotonic() - start < 1
+
+
+async def test_execute_fails_fast_while_rate_limited(
+    api: SectorAlarmAPI, account: FakeAccount, session: FakeSession
+) -> None:
+    """A Retry-After longer than the deadline fails without waiting."""
+    account.rate_limiter.pause(25)
+    session.responses = [FakeResponse(200, {})]
+
+    start = time.monotonic()
+    with pytest.raises(RateLimitedError):
+        await api._execute("POST", URL, {}, timeout=1, priority=True)
+    assert time.monotonic() - start < 1
+    assert not session.requests
+
+
+async def test_execute_logs_in_again_on_401(
+    api: SectorAlarmAPI, account: FakeAccount, session: FakeSession
+) -> None:
+    """A rejected token is replaced and the request sent once more."""
+    session.responses = [FakeResponse(401), FakeResponse(200, [])]
+
+    assert await api._execute("GET", URL) == []
+    assert account.logins == 2
+    assert [headers["Authorization"] for _, _, headers in session.requests] == [
+        "Bearer token-1",
+        "Bearer token-2",
+    ]
+
+
+async def test_execute_records_every_attempt(
+    api: SectorAlarmAPI, session: FakeSession
+) -> None:
+    """Metrics count network attempts with the size of their body."""
+    session.responses = [FakeResponse(502), FakeResponse(200, [1, 2, 3])]
+    metrics = EndpointMetrics()
+
+    await api._execute("GET", URL, metrics=metrics)
+
+    assert metrics.requests == 2
+    assert metrics.errors == 1
+    assert metrics.payload_bytes == len(b"[1, 2, 3]")
+
+
+async def test_malformed_and_empty_bodies(
+    api: SectorAlarmAPI, session: FakeSession
+) -> None:
+    """An empty body is None, a malformed one a PermanentAPIError."""
+    malformed = FakeResponse(200)
+    malformed._body = b"{"
+    session.responses = [FakeResponse(200), malformed]
+
+    assert await api._execute("GET", URL) is None
+    with pytest.raises(PermanentAPIError):
+        await api._execute("GET", URL)
+
+
+def test_circuit_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The circuit opens after the threshold and closes after the cooldown."""
+    now = 1000.0
+    monkeypatch.setattr(client, "time", SimpleNamespace(monotonic=lambda: now))
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+
+    assert not breaker.record_failure()
+    assert not breaker.is_open
+    assert breaker.record_failure()
+    assert breaker.is_open
+
+    now += 60
+    assert not breaker.is_open
+    # The trial call failing opens the circuit again
+    assert breaker.record_failure()
+    assert breaker.is_open
+
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.failures == 0
+
+
+def test_rate_limiter_keeps_reserve_for_priority() -> None:
+    """Background requests leave the reserved tokens to commands."""
+    limiter = RateLimiter(capacity=3, refill=0.001, reserve=2)
+
+    assert limiter._try_acquire(priority=False) == 0
+    assert limiter._try_acquire(priority=False) > 0
+    assert limiter._try_acquire(priority=True) == 0
+    assert limiter._try_acquire(priority=True) == 0
+    assert limiter._try_acquire(priority=True) > 0
+
+
+async def test_rate_limiter_serves_priority_first() -> None:
+    """A queued command gets the next token before a waiting poll."""
+    limiter = RateLimiter(capacity=1, refill=50, reserve=0)
+    limiter.tokens = 0
+    order = []
+
+    async def acquire(name: str, priority: bool) -> None:
+        await limiter.async_acquire(priority)
+        order.append(name)
+
+    poll = asyncio.create_task(acquire("poll", False))
+    await asyncio.sleep(0)
+    command = asyncio.create_task(acquire("command", True))
+    await asyncio.gather(poll, command)
+
+    assert order == ["command", "poll"]
+
+
+async def test_rate_limiter_timeout() -> None:
+    """A wait longer than the timeout raises without sleeping."""
+    limiter = RateLimiter()
+    limiter.pause(25)
+
+    start = time.monotonic()
+    with pytest.raises(RateLimitedError) as err:
+        await limiter.async_acquire(timeout=1)
+    assert time.monotonic() - start < 1
+    assert err.value.retry_after == pytest.approx(25, abs=1)
+    assert limiter._priority_waiting == 0
@@ -0,0 +1,67 @@
+"""Tests for the Sector Alarm coordinator."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from custom_components.sector.coordinator import SectorDataUpdateCoordinator
+from custom_components.sector.model import Locks
+
+
+def _entry(time: str, event_type: str = "lock", user: str = "Ann") -> dict[str, Any]:
+    return {
+        "Time": time,
+        "LockName": "Front door",
+        "EventType": event_type,
+        "User": user,
+        "Channel": "App",
+    }
+
+
+def test_new_log_entries(coordinator: SectorDataUpdateCoordinator) -> None:
+    """Only entries past the high-water mark are returned, oldest first."""
+    first = [
+        _entry("2024-06-01T12:00:00"),
+        _entry("2024-06-01T11:00:00", "unlock"),
+    ]
+    assert coordinator._new_log_entries(first) == first[::-1]
+    assert coordinator._new_log_entries(first) == []
+
+    newer = _entry("2024-06-01T13:00:00", "unlock")
+    assert coordinator._new_log_entries([newer, *first]) == [newer]
+
+
+def test_new_log_entries_at_high_water(
+    coordinator: SectorDataUpdateCoordinator,
+) -> None:
+    """An entry with the time of the mark is new unless it was returned."""
+    seen = _entry("2024-06-01T12:00:00")
+    coordinator._new_log_entries([seen])
+
+    same_time = _entry("2024-06-01T12:00:00", user="Bob")
+    assert coordinator._new_log_entries([same_time, seen]) == [same_time]
+
+
+def test_new_log_entries_oldest_first(
+    coordinator: SectorDataUpdateCoordinator,
+) -> None:
+    """A log sorted oldest first is walked from its end."""
+    logs = [_entry("2024-06-01T11:00:00"), _entry("2024-06-01T12:00:00")]
+    assert coordinator._new_log_entries(logs) == logs
+
+    newer = _entry("2024-06-01T13:00:00")
+    assert coordinator._new_log_entries([*logs, newer]) == [newer]
+
+
+def test_log_entries_held_until_lock_known(
+    coordinator: SectorDataUpdateCoordinator,
+) -> None:
+    """Entries of an unknown lock are kept until the lock shows up."""
+    logs = [_entry("2024-06-01T12:00:00")]
+    assert coordinator._process_event_logs(logs, {}) == set()
+
+    lock = Locks(name="Front door", serial_no="L1")
+    assert coordinator._process_event_logs(logs, {"L1": lock}) == {"L1"}
+    assert list(coordinator._event_logs["L1"]["lock"]) == [
+        {"time": "2024-06-01T12:00:00", "user": "Ann", "channel": "App"}
+    ]